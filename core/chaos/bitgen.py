@@ -0,0 +1,371 @@
+# core/chaos/bitgen.py
+# Aether v2.0 – NIHDE as a numpy.random bit generator
+#
+#     from numpy.random import Generator
+#     rng = Generator(NIHDEBitGenerator(seed=42))
+#     rng.integers(0, 4, size=1_000_000)
+#
+# numpy's Generator only needs a `capsule` holding a bitgen_t and a `lock`.
+# The bitgen_t functions are small C routines that hand out words from a
+# uint64 buffer and call back into Python only when it runs dry; the refill
+# pulls one large batch from the NIHDE bulk API. The extension is built once
+# through cffi into ~/.cache/aether under a name keyed on a hash of its
+# source and imported from there afterwards. Without a C compiler the same
+# struct is filled with cffi ABI-mode callbacks (with a RuntimeWarning),
+# which works but costs a Python call per draw.
+#
+# A refill that raises (a NIHDE error, or a health alarm with
+# raise_on_failure=True) cannot unwind through numpy's C code. The callback's
+# onerror handler records the exception and the bitgen_t stops serving the
+# buffer: further draws get splitmix64 filler words over a counter (never a
+# constant, so numpy's rejection samplers still terminate), and the spent
+# buffer is never handed out again.
+# The recorded exception is raised when the Generator releases `lock`, i.e.
+# as soon as the numpy call that hit it returns, and the next draw refills
+# afresh.
+#
+# NIHDEBitGenerator is an adapter, not a numpy.random.BitGenerator subclass,
+# so it covers only part of that interface: Generator(...), random_raw(),
+# `state` (get and set) and pickling of the adapter itself. There is no
+# seed_seq, spawn() or jumped(), and a Generator wrapping it cannot be
+# unpickled (numpy requires a real BitGenerator there); pickle the adapter or
+# its state and wrap it in a new Generator instead.
+
+import ctypes
+import hashlib
+import importlib.machinery
+import importlib.util
+import os
+import shutil
+import tempfile
+import threading
+import warnings
+
+import numpy as np
+from cffi import FFI
+
+from core.chaos.nihde import NIHDE
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "aether")
+
+_BITGEN_CDEF = """
+typedef struct bitgen {
+    void *state;
+    uint64_t (*next_uint64)(void *st);
+    uint32_t (*next_uint32)(void *st);
+    double (*next_double)(void *st);
+    uint64_t (*next_raw)(void *st);
+} bitgen_t;
+
+typedef struct {
+    uint64_t *buf;
+    size_t len;
+    size_t pos;
+    int error;
+    uint64_t filler;
+    int has_uint32;
+    uint32_t uinteger;
+    void *handle;
+} nihde_buffer_t;
+"""
+
+_API_CDEF = _BITGEN_CDEF + """
+extern "Python" int nihde_refill(void *handle);
+void nihde_bitgen_init(bitgen_t *bg, nihde_buffer_t *st);
+"""
+
+_API_SOURCE = _BITGEN_CDEF + r"""
+static int nihde_refill(void *handle);
+
+static uint64_t nihde_filler(nihde_buffer_t *s)
+{
+    uint64_t z = (s->filler += 0x9e3779b97f4a7c15ULL);
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+    return z ^ (z >> 31);
+}
+
+static uint64_t nihde_next_uint64(void *st)
+{
+    nihde_buffer_t *s = (nihde_buffer_t *)st;
+    if (s->pos >= s->len) {
+        if (s->error || nihde_refill(s->handle) != 0) {
+            s->error = 1;
+            return nihde_filler(s);
+        }
+        s->pos = 0;
+    }
+    return s->buf[s->pos++];
+}
+
+static uint32_t nihde_next_uint32(void *st)
+{
+    nihde_buffer_t *s = (nihde_buffer_t *)st;
+    uint64_t next;
+    if (s->has_uint32) {
+        s->has_uint32 = 0;
+        return s->uinteger;
+    }
+    next = nihde_next_uint64(st);
+    s->has_uint32 = 1;
+    s->uinteger = (uint32_t)(next >> 32);
+    return (uint32_t)(next & 0xffffffff);
+}
+
+static double nihde_next_double(void *st)
+{
+    return (nihde_next_uint64(st) >> 11) * (1.0 / 9007199254740992.0);
+}
+
+void nihde_bitgen_init(bitgen_t *bg, nihde_buffer_t *st)
+{
+    bg->state = st;
+    bg->next_uint64 = nihde_next_uint64;
+    bg->next_uint32 = nihde_next_uint32;
+    bg->next_double = nihde_next_double;
+    bg->next_raw = nihde_next_uint64;
+}
+"""
+
+_backend = None
+
+
+def _import_extension(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _build_extension(name, suffix):
+    # Builds in a private temp dir and moves the result into place with
+    # os.replace(), so another process never sees a half-written file and
+    # an already loaded copy is never overwritten in place.
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmpdir = tempfile.mkdtemp(prefix="build-", dir=CACHE_DIR)
+    try:
+        builder = FFI()
+        builder.cdef(_API_CDEF)
+        builder.set_source(name, _API_SOURCE)
+        built = builder.compile(tmpdir=tmpdir, verbose=False)
+        target = os.path.join(CACHE_DIR, name + suffix)
+        os.replace(built, target)
+        return target
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def _load_backend():
+    # Returns (ffi, lib) for the compiled kernels, or (ffi, None) for the
+    # ABI-mode fallback.
+    global _backend
+    if _backend is not None:
+        return _backend
+    digest = hashlib.sha256((_API_CDEF + _API_SOURCE).encode()).hexdigest()[:16]
+    name = f"_aether_bitgen_{digest}"
+    suffix = importlib.machinery.EXTENSION_SUFFIXES[0]
+    path = os.path.join(CACHE_DIR, name + suffix)
+    try:
+        if not os.path.exists(path):
+            path = _build_extension(name, suffix)
+        module = _import_extension(name, path)
+
+        def refill_error(exc_type, exc_value, tb):
+            # The refill's own frame is the first one in the traceback.
+            if tb is not None and "handle" in tb.tb_frame.f_locals:
+                module.ffi.from_handle(tb.tb_frame.f_locals["handle"])._record_error(exc_value)
+
+        @module.ffi.def_extern(error=-1, onerror=refill_error)
+        def nihde_refill(handle):
+            module.ffi.from_handle(handle)._refill()
+            return 0
+
+        _backend = (module.ffi, module.lib)
+    except Exception as e:
+        warnings.warn(f"NIHDEBitGenerator: compiled kernels unavailable ({e!r}); "
+                      "falling back to per-draw cffi callbacks", RuntimeWarning)
+        ffi = FFI()
+        ffi.cdef(_BITGEN_CDEF)
+        _backend = (ffi, None)
+    return _backend
+
+
+def _splitmix64(st):
+    # Same filler as nihde_filler() in the compiled kernels.
+    mask = (1 << 64) - 1
+    st.filler = z = (st.filler + 0x9E3779B97F4A7C15) & mask
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+    return z ^ (z >> 31)
+
+
+def _capsule(address):
+    new = ctypes.pythonapi.PyCapsule_New
+    new.restype = ctypes.py_object
+    new.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+    return new(address, b"BitGenerator", None)
+
+
+class _ErrorLock:
+    # The lock numpy's Generator takes around every call into the bitgen_t;
+    # releasing it raises whatever a refill callback recorded meanwhile.
+    def __init__(self, owner):
+        self._owner = owner
+        self._lock = threading.Lock()
+
+    def acquire(self, *args, **kwargs):
+        return self._lock.acquire(*args, **kwargs)
+
+    def release(self):
+        self._lock.release()
+
+    def __enter__(self):
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            self._owner._raise_pending()
+        finally:
+            self._lock.release()
+
+
+class NIHDEBitGenerator:
+    # source="mantissa" packs NIHDE.mantissa_bits() output (fast, raw chaos);
+    # source="extract" uses the SHAKE-256 conditioned NIHDE.extract_bytes().
+    def __init__(self, engine=None, seed=None, source="mantissa", buffer_words=1 << 16):
+        if source not in ("mantissa", "extract"):
+            raise ValueError("source must be 'mantissa' or 'extract'")
+        self.engine = engine if engine is not None else NIHDE(use_live_qrng=False, seed=seed)
+        self.source = source
+        self.lock = _ErrorLock(self)
+        self._error = None
+        self._buf = np.empty(buffer_words, dtype=np.uint64)
+
+        ffi, lib = _load_backend()
+        self._ffi = ffi
+        self._state = ffi.new("nihde_buffer_t *")
+        self._state.buf = ffi.cast("uint64_t *", self._buf.ctypes.data)
+        self._state.len = buffer_words
+        self._state.pos = buffer_words
+        self._handle = ffi.new_handle(self)
+        self._state.handle = self._handle
+        self._bitgen = ffi.new("bitgen_t *")
+        if lib is not None:
+            lib.nihde_bitgen_init(self._bitgen, self._state)
+        else:
+            self._callbacks = self._abi_callbacks(ffi)
+        self.capsule = _capsule(int(ffi.cast("uintptr_t", self._bitgen)))
+
+    @property
+    def state(self):
+        # Engine snapshot (see NIHDE.snapshot) plus the unread buffer, so
+        # a restored generator continues the same word stream.
+        with self.lock:
+            return {"bit_generator": type(self).__name__, "source": self.source,
+                    "engine": self.engine.snapshot(), "buffer": self._buf.copy(),
+                    "pos": int(self._state.pos), "has_uint32": int(self._state.has_uint32),
+                    "uinteger": int(self._state.uinteger)}
+
+    @state.setter
+    def state(self, value):
+        if value.get("bit_generator") != type(self).__name__:
+            raise ValueError(f"state must be for {type(self).__name__}")
+        if len(value["buffer"]) != len(self._buf):
+            raise ValueError("state buffer size does not match buffer_words")
+        with self.lock:
+            self.engine = NIHDE.restore(value["engine"])
+            self.source = value["source"]
+            self._buf[:] = value["buffer"]
+            self._state.pos = value["pos"]
+            self._state.error = 0
+            self._error = None
+            self._state.has_uint32 = value["has_uint32"]
+            self._state.uinteger = value["uinteger"]
+
+    def __reduce__(self):
+        return _from_state, (self.state,)
+
+    def _record_error(self, exc):
+        self._state.error = 1
+        if self._error is None:
+            self._error = exc
+
+    def _raise_pending(self):
+        if not self._state.error:
+            return
+        exc = self._error or RuntimeError("NIHDEBitGenerator refill failed")
+        self._error = None
+        self._state.error = 0
+        self._state.has_uint32 = 0
+        raise exc
+
+    def _abi_callbacks(self, ffi):
+        st = self._state
+
+        def onerror(exc_type, exc_value, tb):
+            self._record_error(exc_value)
+
+        def next_uint64(_):
+            if st.pos >= st.len:
+                if st.error:
+                    return _splitmix64(st)
+                self._refill()
+                st.pos = 0
+            st.pos += 1
+            return int(self._buf[st.pos - 1])
+
+        def next_uint32(_):
+            if st.has_uint32:
+                st.has_uint32 = 0
+                return st.uinteger
+            v = next_uint64(None)
+            st.has_uint32 = 1
+            st.uinteger = v >> 32
+            return v & 0xFFFFFFFF
+
+        def next_double(_):
+            return (next_uint64(None) >> 11) * (1.0 / 9007199254740992.0)
+
+        callbacks = (ffi.callback("uint64_t(void *)", next_uint64, onerror=onerror),
+                     ffi.callback("uint32_t(void *)", next_uint32, onerror=onerror),
+                     ffi.callback("double(void *)", next_double, onerror=onerror))
+        self._bitgen.state = st
+        self._bitgen.next_uint64, self._bitgen.next_uint32, self._bitgen.next_double = callbacks
+        self._bitgen.next_raw = callbacks[0]
+        return callbacks
+
+    @property
+    def compiled(self):
+        return _load_backend()[1] is not None
+
+    def _refill(self):
+        nbytes = self._buf.nbytes
+        if self.source == "extract":
+            raw = self.engine.extract_bytes(nbytes)
+        else:
+            raw = self.engine.mantissa_bits(8 * nbytes)
+        self._buf[:] = np.frombuffer(raw, dtype=np.uint64)
+
+    def random_raw(self, size=None):
+        # Raw 64-bit words straight from the buffer.
+        with self.lock:
+            n = 1 if size is None else int(np.prod(size))
+            out = np.empty(n, dtype=np.uint64)
+            done = 0
+            while done < n:
+                if self._state.pos >= self._state.len:
+                    self._refill()
+                    self._state.pos = 0
+                take = min(n - done, self._state.len - self._state.pos)
+                out[done:done + take] = self._buf[self._state.pos:self._state.pos + take]
+                self._state.pos += take
+                done += take
+        return int(out[0]) if size is None else out.reshape(size)
+
+
+def _from_state(state):
+    bg = NIHDEBitGenerator(NIHDE.restore(state["engine"]), source=state["source"],
+                           buffer_words=len(state["buffer"]))
+    bg.state = state
+    return bg
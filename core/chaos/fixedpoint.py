@@ -0,0 +1,127 @@
+# core/chaos/fixedpoint.py
+# Aether v2.0 – Integer fixed-point Rössler ensemble
+#
+# State and parameters are int64 in Q(63-F).F format (F = frac_bits, 24 by
+# default). Products are rounded half-up with an arithmetic shift, so every
+# step is plain integer arithmetic and the bit stream is identical on every
+# platform, compiler and NumPy build. Initial states are drawn as integers
+# for the same reason.
+#
+# Range: with F=24 a product of two state values must stay below 2**63, i.e.
+# |u| * |v| < 2**15 in real units; the Rössler attractor (|x|, |y| < 20,
+# z < 50) is well inside that.
+#
+# The state is held as a (3, N) block (`state` is its (N, 3) transpose), so
+# the three dt updates of a step run as one in-place pass over the block
+# with no temporaries. How that compares with the float ensemble depends on
+# the machine: at 8192 lanes a decision has measured from about 0.8x to
+# 2.4x the float time. NIHDE(fixed_point=True) uses this class for its lane
+# bank and the same arithmetic on Python ints for the scalar path.
+
+import numpy as np
+
+FRAC_BITS = 24
+
+
+class FixedPointEnsemble:
+    def __init__(self, n, a=0.2, b=0.2, c=None, dt=0.01, frac_bits=FRAC_BITS, seed=None):
+        self.n = int(n)
+        self._setup(frac_bits)
+        ss = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self._seed_seq = ss
+        self.seed = ss.entropy
+        self.rng = np.random.default_rng(ss)
+
+        q = self.quantize
+        self._s = np.empty((3, self.n), dtype=np.int64)
+        self._s[0] = self.rng.integers(q(-7), q(7), self.n)
+        self._s[1] = self.rng.integers(q(-7), q(7), self.n)
+        self._s[2] = self.rng.integers(0, q(10), self.n)
+        if c is None:
+            c = self.rng.integers(q(2.7), q(9.7), self.n)
+        else:
+            c = q(c)
+        self.a = q(a)
+        self.b = q(b)
+        self.c = np.broadcast_to(np.asarray(c, dtype=np.int64), (self.n,)).copy()
+        self.dt = q(dt)
+        self.step_count = 0
+
+    def _setup(self, frac_bits):
+        if not 8 <= frac_bits <= 28:
+            raise ValueError("frac_bits must be between 8 and 28")
+        self.frac_bits = frac_bits
+        self.one = 1 << frac_bits
+        self._half = np.int64(1 << (frac_bits - 1))
+        self._shift = np.int64(frac_bits)
+        self._d = None
+
+    @property
+    def state(self):
+        return self._s.T
+
+    @state.setter
+    def state(self, value):
+        self._s = np.ascontiguousarray(np.asarray(value, dtype=np.int64).T)
+
+    def quantize(self, v):
+        # Scaling by a power of two is exact, so this rounding is portable.
+        return np.round(np.asarray(v, dtype=np.float64) * self.one).astype(np.int64)
+
+    def to_float(self):
+        return self.state / self.one
+
+    def step(self, steps=1):
+        s = self._s
+        if self._d is None or self._d.shape != s.shape:
+            self._d = np.empty_like(s)
+        d = self._d
+        x, y, z = s
+        dx, dy, dz = d
+        a, b, c, dt, h, f = self.a, self.b, self.c, self.dt, self._half, self._shift
+        for _ in range(steps):
+            np.add(y, z, out=dx)
+            np.negative(dx, out=dx)
+            np.multiply(y, a, out=dy)
+            dy += h
+            dy >>= f
+            dy += x
+            np.subtract(x, c, out=dz)
+            dz *= z
+            dz += h
+            dz >>= f
+            dz += b
+            # x, y, z += round(dt * (dx, dy, dz)) in one pass
+            d *= dt
+            d += h
+            d >>= f
+            s += d
+        self.step_count += steps
+
+    def decide(self):
+        # Parity of floor(z * 1000), the integer analogue of NIHDE.decide().
+        self.step(10)
+        return (((self._s[2] * 1000) >> self._shift) & 1).astype(np.uint8)
+
+    def decide_bits(self, n):
+        # Packed like NIHDE.decide_bits(): ceil(n / 8) bytes, pad bits zero.
+        rounds = -(-n // self.n)
+        bits = np.empty((rounds, self.n), dtype=np.uint8)
+        for r in range(rounds):
+            bits[r] = self.decide()
+        return np.packbits(bits.ravel()[:n])
+
+    def state_bits(self, n, bits_per_sample=8, skip=4, steps=1):
+        # Low-order state bits (above `skip` rounding-noise bits) of x, y
+        # and z after every `steps` steps; bit-exact like the state itself.
+        k = bits_per_sample
+        if k < 1 or k + skip > self.frac_bits:
+            raise ValueError("bits_per_sample + skip must fit in frac_bits")
+        per_round = self.n * 3 * k
+        rounds = -(-n // per_round)
+        shifts = np.arange(skip + k - 1, skip - 1, -1, dtype=np.int64)
+        out = np.empty((rounds, self.n * 3, k), dtype=np.uint8)
+        for r in range(rounds):
+            self.step(steps)
+            out[r] = (self.state.reshape(-1, 1) >> shifts) & 1
+        return np.packbits(out.ravel()[:n])
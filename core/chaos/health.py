@@ -0,0 +1,170 @@
+# core/chaos/health.py
+# Aether v2.0 – Continuous SP 800-90B health tests (section 4.4)
+#
+# Every lane (and, for raw samples, every lane coordinate) is treated as its
+# own noise source: a chunk is a (rounds, columns) array and both tests run
+# down the columns with array operations, carrying run lengths and partial
+# windows across chunks.
+#
+#   Repetition Count Test:   a run of C = 1 + ceil(-log2(alpha) / H)
+#                            identical samples fails.
+#   Adaptive Proportion Test: in each window of W samples (1024 binary, 512
+#                            otherwise) the first sample may occur at most
+#                            C - 1 times, C = 1 + CRITBINOM(W, 2**-H, 1 - alpha).
+#
+# H is the assessed min-entropy per sample. Samples are compared for
+# equality only, so float64 words are tested through their uint64 view.
+
+import math
+
+import numpy as np
+
+
+def _critbinom(n, p, q):
+    # Smallest k with P(X <= k) >= q for X ~ Binomial(n, p).
+    k = np.arange(n + 1)
+    logpmf = (math.lgamma(n + 1) - np.array([math.lgamma(i + 1) + math.lgamma(n - i + 1) for i in k])
+              + k * math.log(p) + (n - k) * (math.log1p(-p) if p < 1 else 0.0))
+    cdf = np.cumsum(np.exp(logpmf))
+    return int(np.searchsorted(cdf, q))
+
+
+class HealthTests:
+    def __init__(self, min_entropy=1.0, alpha=2 ** -30, binary=False, window=None,
+                 callback=None, name="samples"):
+        if min_entropy <= 0:
+            raise ValueError("min_entropy must be positive")
+        self.name = name
+        self.min_entropy = min_entropy
+        self.alpha = alpha
+        self.window = window or (1024 if binary else 512)
+        self.rct_cutoff = 1 + math.ceil(-math.log2(alpha) / min_entropy)
+        self.apt_cutoff = 1 + _critbinom(self.window, 2.0 ** -min_entropy, 1 - alpha)
+        self.callback = callback
+        self.samples = 0
+        self.failures = {"rct": 0, "apt": 0}
+        self.reset()
+
+    def reset(self):
+        self._columns = None
+        self._last = None
+        self._tail = None
+        self._pending = None
+
+    @property
+    def alarm(self):
+        return self.failures["rct"] + self.failures["apt"] > 0
+
+    def feed(self, chunk):
+        # chunk: (rounds, columns) samples, one column per source, or a 1-D
+        # array for a single source. Returns the failures found in it; their
+        # offset is the number of samples fed before this chunk.
+        x = np.asarray(chunk)
+        if x.dtype.kind == "f":
+            x = x.view(np.uint64 if x.itemsize == 8 else np.uint32)
+        if x.ndim == 1:
+            x = x[:, None]
+        if len(x) == 0:
+            return []
+        if x.shape[1] != self._columns:
+            self.reset()
+            self._columns = x.shape[1]
+            self._tail = np.zeros((self.rct_cutoff - 2, x.shape[1]), dtype=bool)
+            self._pending = x[:0].copy()
+        failures = self._rct(x) + self._apt(x)
+        self.samples += x.size
+        for failure in failures:
+            self.failures[failure["test"]] += 1
+            if self.callback is not None:
+                self.callback(failure)
+        return failures
+
+    def _rct(self, x):
+        # same[t] marks x[t] == x[t - 1]; a run of C samples is C - 1 True
+        # in a row, found with log2(C) shifted ANDs. The last C - 2 rows of
+        # `same` are carried so runs across chunk borders are caught.
+        k = self.rct_cutoff - 1
+        same = np.empty((len(self._tail) + len(x), x.shape[1]), dtype=bool)
+        same[:len(self._tail)] = self._tail
+        if self._last is None:
+            # First sample of a fresh stream: nothing to repeat yet.
+            same[len(self._tail)] = False
+        else:
+            np.equal(x[0], self._last, out=same[len(self._tail)])
+        np.equal(x[1:], x[:-1], out=same[len(self._tail) + 1:])
+        self._last = x[-1].copy()
+        self._tail = same[len(same) - len(self._tail):].copy()
+        if not same.any():
+            return []
+        # run[t] = all(same[t - width + 1 .. t]), width doubled up to k.
+        run, width = same, 1
+        while width < k:
+            step = min(width, k - width)
+            run = run[step:] & run[:-step]
+            width += step
+            if not run.any():
+                return []
+        bad = np.nonzero(run.any(axis=0))[0]
+        return [{"test": "rct", "stream": self.name, "column": int(j), "offset": self.samples,
+                 "cutoff": self.rct_cutoff} for j in bad]
+
+    def _apt(self, x):
+        # Windows never straddle calls: the pending rows are completed from
+        # the head of x and the remainder is reshaped in place.
+        w = self.window
+        need = (w - len(self._pending)) % w
+        blocks = []
+        if len(self._pending):
+            if len(x) < need:
+                self._pending = np.concatenate((self._pending, x))
+                return []
+            blocks.append(np.concatenate((self._pending, x[:need])))
+        full = (len(x) - need) // w * w
+        blocks.append(x[need:need + full])
+        self._pending = x[need + full:].copy()
+        failures = []
+        for block in blocks:
+            if not len(block):
+                continue
+            windows = block.reshape(-1, w, x.shape[1])
+            counts = np.add.reduce(windows == windows[:, :1], axis=1, dtype=np.uint16)
+            rows, cols = np.nonzero(counts >= self.apt_cutoff)
+            failures += [{"test": "apt", "stream": self.name, "column": int(j), "offset": self.samples,
+                          "count": int(counts[i, j]), "cutoff": self.apt_cutoff}
+                         for i, j in zip(rows, cols)]
+        return failures
+
+    def to_dict(self):
+        return {"samples": self.samples, "min_entropy": self.min_entropy, "alpha": self.alpha,
+                "rct_cutoff": self.rct_cutoff, "apt_window": self.window,
+                "apt_cutoff": self.apt_cutoff, "failures": dict(self.failures)}
+
+
+class EngineHealth:
+    # Attached through NIHDE.enable_health(): decide bits are binary samples
+    # per lane, raw samples (behind mantissa_bits and extract_bytes) are
+    # float64 words per lane coordinate. callback(failure) runs on every
+    # failure; with raise_on_failure=True the generating call also raises.
+    def __init__(self, callback=None, alpha=2 ** -30, bit_entropy=1.0, sample_entropy=1.0,
+                 raise_on_failure=False):
+        self.callback = callback
+        self.raise_on_failure = raise_on_failure
+        self.tests = {
+            "decide_bits": HealthTests(bit_entropy, alpha, binary=True, callback=callback,
+                                       name="decide_bits"),
+            "raw_samples": HealthTests(sample_entropy, alpha, callback=callback, name="raw_samples"),
+        }
+
+    @property
+    def alarm(self):
+        return any(t.alarm for t in self.tests.values())
+
+    def feed(self, stream, chunk):
+        failures = self.tests[stream].feed(chunk)
+        if failures and self.raise_on_failure:
+            f = failures[0]
+            raise RuntimeError(f"health test failure: {f['test']} on {stream} column {f['column']}")
+        return failures
+
+    def to_dict(self):
+        return {name: t.to_dict() for name, t in self.tests.items()}
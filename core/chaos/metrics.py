@@ -0,0 +1,106 @@
+# core/chaos/metrics.py
+# Aether v2.0 – Engine instrumentation: counters and HDR-style latency histograms
+#
+# LatencyHistogram uses log-linear buckets like HdrHistogram: values below
+# 2**precision ns are exact, above that every power of two is split into
+# 2**(precision - 1) buckets, i.e. about 1.6% relative error at precision=7.
+# Recording is one bit_length() and one list increment.
+
+import json
+import threading
+import time
+
+import numpy as np
+
+
+class LatencyHistogram:
+    def __init__(self, precision=7):
+        self.precision = precision
+        self.counts = [0] * (1 << precision)
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, v):
+        p = self.precision
+        shift = v.bit_length() - p
+        if shift <= 0:
+            return v
+        return (1 << p) + (shift - 1) * (1 << (p - 1)) + (v >> shift) - (1 << (p - 1))
+
+    def _lower(self, i):
+        p = self.precision
+        if i < (1 << p):
+            return i
+        shift, sub = divmod(i - (1 << p), 1 << (p - 1))
+        return (sub + (1 << (p - 1))) << (shift + 1)
+
+    def record(self, ns):
+        i = self._index(ns)
+        if i >= len(self.counts):
+            self.counts.extend([0] * (i + 1 - len(self.counts)))
+        self.counts[i] += 1
+        self.total += 1
+        self.sum += ns
+        if self.min is None or ns < self.min:
+            self.min = ns
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, q):
+        if not self.total:
+            return 0
+        rank = q / 100 * self.total
+        cumulative = np.cumsum(self.counts)
+        i = int(np.searchsorted(cumulative, max(rank, 1)))
+        return min(self._lower(i + 1) - 1, self.max)
+
+    def to_dict(self):
+        return {
+            "count": self.total,
+            "min_ns": self.min or 0,
+            "max_ns": self.max,
+            "mean_ns": self.sum / self.total if self.total else 0.0,
+            "p50_ns": self.percentile(50),
+            "p90_ns": self.percentile(90),
+            "p99_ns": self.percentile(99),
+            "p99.9_ns": self.percentile(99.9),
+        }
+
+
+class EngineMetrics:
+    # Attached through NIHDE.enable_metrics(). Counters always run once
+    # attached; per-call perf_counter_ns timing only with timing=True.
+    def __init__(self, engine, timing=True):
+        self.engine = engine
+        self.timing = timing
+        self.calls = {}
+        self.bits = 0
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, op, ns, bits):
+        with self._lock:
+            self.calls[op] = self.calls.get(op, 0) + 1
+            self.bits += bits
+            if ns is not None:
+                hist = self.histograms.get(op)
+                if hist is None:
+                    hist = self.histograms[op] = LatencyHistogram()
+                hist.record(ns)
+
+    def to_dict(self):
+        lanes = self.engine._lanes
+        with self._lock:
+            return {
+                "steps": self.engine.step_count,
+                "lane_steps": 0 if lanes is None else lanes.step_count * lanes.n,
+                "bits": self.bits,
+                "calls": dict(self.calls),
+                "latency": {op: h.to_dict() for op, h in self.histograms.items()},
+                "timestamp_ns": time.time_ns(),
+            }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
@@ -1,46 +1,673 @@
 import numpy as np
-import hashlib
-import requests
+import asyncio
+import json
+import os
+import struct
+import threading
+import warnings
+from time import perf_counter_ns
+
+from core.chaos.extractor import Extractor
+from core.chaos.fixedpoint import FRAC_BITS, FixedPointEnsemble
+from core.chaos.health import EngineHealth
+from core.chaos.integrators import get_integrator
+from core.chaos.metrics import EngineMetrics
+from core.chaos.pool import pool_seed
+from core.chaos.prefetch import Prefetcher
+from core.chaos.qrng import QRNGSeeder
+from core.chaos.systems import get_system
+from core.chaos.trajectory import create_trajectory
+
+
+SNAPSHOT_MAGIC = b"AETHSNP1"
+
+# spawn_key element of the lane-bank branch; far above any spawn() index.
+LANE_KEY = 0x4C414E45
+
+
+def _seed_sequence(seed):
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def _make_integrator(system, integrator, dt):
+    integ = get_integrator(integrator, dt)
+    cap = system.dt_cap(integrator)
+    if dt is None and cap is not None and integ.dt > cap:
+        integ = get_integrator(integrator, cap)
+    return integ
+
+
+def _seed_state(ss):
+    return {"entropy": ss.entropy, "spawn_key": list(ss.spawn_key),
+            "n_children_spawned": ss.n_children_spawned}
+
+
+def _restore_seed(d):
+    return np.random.SeedSequence(d["entropy"], spawn_key=d["spawn_key"],
+                                  n_children_spawned=d["n_children_spawned"])
+
+
+def _lane_seed(ss, lanes):
+    # Fixed branch (entropy, spawn_key + (LANE_KEY, lanes)) of the engine's
+    # SeedSequence: the same for every rebuild of an n-lane bank, and it
+    # leaves n_children_spawned (and so spawn()) untouched.
+    return np.random.SeedSequence(ss.entropy, spawn_key=tuple(ss.spawn_key) + (LANE_KEY, lanes),
+                                  pool_size=ss.pool_size)
+
+
+def _restore_rng(state):
+    rng = np.random.Generator(np.random.PCG64(0))
+    rng.bit_generator.state = state
+    return rng
+
 
 class NIHDE:
-    def __init__(self, use_live_qrng=True):
-        self.x = np.random.uniform(-1, 1)
-        self.y = np.random.uniform(-1, 1)
-        self.z = np.random.uniform(0, 10)
-        self.a = 0.2
-        self.b = 0.2
-        self.c = 5.7 + np.random.uniform(-1, 2)
-
-        if use_live_qrng:
-            try:
-                r = requests.get("https://qrng.anu.edu.au/API/jsonI.php?length=10&type=uint16", timeout=5)
-                if r.json().get("success"):
-                    seed = np.array(r.json()["data"])
-                    np.random.seed(int(hashlib.sha256(seed.tobytes()).hexdigest(), 16) % 2**32)
-                    print("Live QRNG seed fetched from ANU")
-            except:
-                print("Live QRNG unavailable → using local entropy")
-
-        self.x += np.random.uniform(-6, 6)
-        self.y += np.random.uniform(-6, 6)
-        self.c += np.random.uniform(-2, 2)
-
-    def _step(self):
-        dx = -self.y - self.z
-        dy = self.x + self.a * self.y
-        dz = self.b + self.z * (self.x - self.c)
-        self.x += 0.01 * dx
-        self.y += 0.01 * dy
-        self.z += 0.01 * dz
+    def __init__(self, use_live_qrng=True, integrator="euler", dt=None, seed=None,
+                 system="rossler", param_table=None, fixed_point=False):
+        # Each engine owns its Generator; seed=None draws fresh OS entropy,
+        # which is kept in self.seed so the run can be replayed.
+        #
+        # fixed_point=True (Rössler / Euler only) integrates in int64
+        # Q(63-F).F arithmetic, see core.chaos.fixedpoint: the lane bank is a
+        # FixedPointEnsemble and the scalar path does the same integer steps,
+        # so decisions replay bit for bit on any platform. The state and
+        # parameters stay floats on the 2**-24 grid; values set off the grid
+        # are rounded to it at the next step. raw_samples() then returns the
+        # int64 state words and mantissa_bits() their low fractional bits.
+        if fixed_point and (system not in ("rossler", get_system("rossler")) or integrator != "euler"):
+            raise ValueError("fixed_point requires system='rossler' and integrator='euler'")
+        self.fixed_point = bool(fixed_point)
+        self._seed_seq = _seed_sequence(seed)
+        self.seed = self._seed_seq.entropy
+        self.rng = np.random.default_rng(self._seed_seq)
+        self._setup(system, integrator, dt)
+
+        self.state = self.system.initial(self.rng, 1)[0]
+        for name, values in self.system.sample_params(self.rng, 1).items():
+            setattr(self, name, float(values[0]))
+        # param_table: optional (M, P) table of verified parameter rows in the
+        # system's order, e.g. SweepResult.safe_table(); one row is drawn
+        # instead of the default parameter jitter.
+        self.param_table = None
+        if param_table is not None:
+            self.param_table = np.asarray(param_table, dtype=np.float64).reshape(-1, len(self.param_names))
+            row = self.param_table[self.rng.integers(len(self.param_table))]
+            for name, value in zip(self.param_names, row):
+                setattr(self, name, float(value))
+        self._lanes = None
+        self._prefetch = None
+        self.metrics = None
+        self.health = None
+        self.step_count = 0
+
+        # Live QRNG never blocks startup: the engine runs on OS entropy and a
+        # background thread draws the quantum seed from the on-disk pool
+        # (core.chaos.pool, one ANU request per batch), which is mixed in by
+        # _mix_qrng() at the next integration call.
+        self.qrng_seed = None
+        self.qrng_source = None
+        self.qrng_step = None
+        self._qrng_pending = None
+        self._qrng_lock = threading.RLock()
+        self._qrng = None
+        if seed is None and use_live_qrng:
+            self._qrng = QRNGSeeder(self._qrng_arrived, self._qrng_failed, fetch=pool_seed)
+
+    def _qrng_arrived(self, result):
+        # result: (seed, source label) from core.chaos.pool.pool_seed().
+        self._qrng_pending = result
+        print(f"Live QRNG seed drawn from {result[1]}")
+
+    def _qrng_failed(self, error):
+        print("Live QRNG unavailable → using local entropy")
+
+    def _mix_qrng(self):
+        # Transition: the seed becomes SeedSequence([old entropy..., qrng]),
+        # self.rng is rebuilt from it and the trajectory restarts from a fresh
+        # initial state drawn from that rng, keeping the parameters. The lane
+        # bank is dropped and rebuilt from the mixed seed on the next bulk
+        # call. qrng_step records the step_count at which this happened;
+        # decisions already in a prefetch ring are not replaced. The caller's
+        # thread and the prefetch worker can both get here, so the swap and
+        # the rebuild run under _qrng_lock, which also guards lane-bank setup.
+        with self._qrng_lock:
+            pending, self._qrng_pending = self._qrng_pending, None
+            if pending is None:
+                return
+            value, source = pending
+            prior = list(self.seed) if isinstance(self.seed, (list, tuple)) else [self.seed]
+            self._seed_seq = np.random.SeedSequence(prior + [value])
+            self.seed = self._seed_seq.entropy
+            self.rng = np.random.default_rng(self._seed_seq)
+            self.state = self.system.initial(self.rng, 1)[0]
+            self._lanes = None
+            self.qrng_seed = value
+            self.qrng_source = source
+            self.qrng_step = self.step_count
+
+    def wait_qrng(self, timeout=None):
+        # Blocks until the QRNG fetch has finished (or timeout) and mixes the
+        # seed in; returns True if the engine is now QRNG-seeded.
+        if self._qrng is not None and self._qrng.wait(timeout):
+            self._mix_qrng()
+        return self.qrng_seed is not None
+
+    def _setup(self, system, integrator, dt):
+        self.system = get_system(system)
+        self.param_names = list(self.system.params)
+        self.integrator = integrator
+        self._integrator = _make_integrator(self.system, integrator, dt)
+        self.dt = self._integrator.dt
+        # Rössler under Euler keeps the scalar float fast path; everything
+        # else goes through the batched kernels on a length-d state array.
+        self._fast = self.system.name == "rossler" and integrator == "euler"
+
+    @property
+    def x(self):
+        return self.state[0]
+
+    @x.setter
+    def x(self, value):
+        self.state[0] = value
+
+    @property
+    def y(self):
+        return self.state[1]
+
+    @y.setter
+    def y(self, value):
+        self.state[1] = value
+
+    @property
+    def z(self):
+        return self.state[2]
+
+    @z.setter
+    def z(self, value):
+        self.state[2] = value
+
+    def param_values(self):
+        return {name: getattr(self, name) for name in self.param_names}
+
+    def _params(self):
+        return [getattr(self, name) for name in self.param_names]
+
+    def _derivative(self, s):
+        return self.system.rhs(s, *self._params())
+
+    def spawn(self, k):
+        # Children are seeded from independent SeedSequence branches of this
+        # engine; no QRNG round trip, and the same root seed respawns the same
+        # children in order.
+        return [NIHDE(use_live_qrng=False, integrator=self.integrator, dt=self.dt, seed=child,
+                      system=self.system, param_table=self.param_table, fixed_point=self.fixed_point)
+                for child in self._seed_seq.spawn(k)]
+
+    def _advance(self, steps):
+        if self._qrng_pending is not None:
+            self._mix_qrng()
+        self.step_count += steps
+        if self.fixed_point:
+            self._fixed_steps(steps)
+            return
+        if not self._fast:
+            s = self.state
+            for _ in range(steps):
+                s = self._integrator.step(self._derivative, s, self._params())
+            self.state = s
+            return
+        s = self.state
+        x, y, z = float(s[0]), float(s[1]), float(s[2])
+        a, b, c, dt = self.a, self.b, self.c, self.dt
+        for _ in range(steps):
+            x, y, z = x + dt * (-y - z), y + dt * (x + a * y), z + dt * (b + z * (x - c))
+        s[0], s[1], s[2] = x, y, z
+
+    def _fixed_steps(self, steps, flat=None):
+        # FixedPointEnsemble.step() on Python ints, which cannot overflow, so
+        # both agree bit for bit; every state is written to `flat` if given.
+        one, h, f = 1 << FRAC_BITS, 1 << (FRAC_BITS - 1), FRAC_BITS
+        s = self.state
+        x, y, z = (round(float(v) * one) for v in s)
+        a, b, c, dt = (round(float(v) * one) for v in (self.a, self.b, self.c, self.dt))
+        for i in range(0, 3 * steps, 3):
+            dx = -y - z
+            dy = x + ((a * y + h) >> f)
+            dz = b + ((z * (x - c) + h) >> f)
+            x += (dt * dx + h) >> f
+            y += (dt * dy + h) >> f
+            z += (dt * dz + h) >> f
+            if flat is not None:
+                flat[i] = x / one
+                flat[i + 1] = y / one
+                flat[i + 2] = z / one
+        s[0], s[1], s[2] = x / one, y / one, z / one
+
+    def decide(self):
+        m = self.metrics
+        if m is not None:
+            t0 = perf_counter_ns() if m.timing else None
+            bit = self._decide()
+            m.record("decide", None if t0 is None else perf_counter_ns() - t0, 1)
+            return bit
+        return self._decide()
+
+    def _decide(self):
+        if self._prefetch is not None:
+            return self._prefetch.pop()
+        self._advance(10)
+        if self.fixed_point:
+            return (round(float(self.state[2]) * (1 << FRAC_BITS)) * 1000 >> FRAC_BITS) & 1
+        return int(self.state[self.system.bit_axis] * 1000) % 2
+
+    def enable_metrics(self, timing=True):
+        # Counters for calls and bits plus, with timing=True, per-call
+        # latency histograms (see core.chaos.metrics). When disabled the hot
+        # paths pay a single attribute check.
+        self.metrics = EngineMetrics(self, timing)
+        return self.metrics
+
+    def disable_metrics(self):
+        self.metrics = None
+
+    def enable_health(self, callback=None, alpha=2 ** -30, bit_entropy=1.0, sample_entropy=1.0,
+                      raise_on_failure=False):
+        # Continuous SP 800-90B repetition count and adaptive proportion tests
+        # on every bulk chunk (decide_bits, including the prefetch worker, and
+        # raw_samples behind mantissa_bits / extract_bytes); see
+        # core.chaos.health. The scalar decide() path is not tested.
+        self.health = EngineHealth(callback, alpha, bit_entropy, sample_entropy, raise_on_failure)
+        return self.health
+
+    def disable_health(self):
+        self.health = None
+
+    def start_prefetch(self, capacity=1 << 16, low_water=None, lanes=1024):
+        # Opt-in: decide() pops from a ring that a worker thread refills with
+        # decide_bits() output, so it no longer integrates on the caller's
+        # thread. Stop prefetching before snapshot() or spawn().
+        if self._prefetch is None:
+            self._prefetch = Prefetcher(lambda n: np.unpackbits(self._decide_bits(n, lanes))[:n],
+                                        capacity, low_water)
+        return self._prefetch
+
+    async def stream(self, rate=None, batch=4096, arrays=False, lanes=1024):
+        # Async decision stream: `async for bit in engine.stream(rate=10)`.
+        # Batches of `batch` decisions come from decide_bits() on a worker
+        # thread, so the event loop never runs the integrator. rate caps
+        # decisions per second; arrays=True yields whole uint8 batches.
+        # Not for use together with start_prefetch().
+        loop = asyncio.get_running_loop()
+        due = loop.time()
+        while True:
+            packed = await asyncio.to_thread(self.decide_bits, batch, lanes)
+            bits = np.unpackbits(packed)[:batch]
+            if arrays:
+                if rate is not None:
+                    due += batch / rate
+                    await asyncio.sleep(max(0.0, due - loop.time()))
+                yield bits
+                continue
+            for bit in bits.tolist():
+                if rate is not None:
+                    due += 1 / rate
+                    delay = due - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                yield bit
+            await asyncio.sleep(0)
+
+    def stop_prefetch(self):
+        if self._prefetch is not None:
+            self._prefetch.stop()
+            self._prefetch = None
+
+    def decide_bits(self, n, lanes=1024):
+        m = self.metrics
+        if m is not None:
+            t0 = perf_counter_ns() if m.timing else None
+            out = self._decide_bits(n, lanes)
+            m.record("decide_bits", None if t0 is None else perf_counter_ns() - t0, n)
+            return out
+        return self._decide_bits(n, lanes)
+
+    def _decide_bits(self, n, lanes):
+        # Bulk bits come from a bank of lanes sharing this engine's parameters,
+        # so n bits cost ceil(n / lanes) vectorized decisions instead of n calls.
+        # Returns np.packbits output: ceil(n / 8) bytes, trailing pad bits zero.
+        if lanes % 8:
+            raise ValueError("lanes must be a multiple of 8")
+        bank = self._lane_bank(lanes)
+        row = lanes // 8
+        rounds = -(-n // lanes)
+        out = np.empty(rounds * row, dtype=np.uint8)
+        for r in range(rounds):
+            out[r * row:(r + 1) * row] = np.packbits(bank.decide())
+        if self.health is not None:
+            self.health.feed("decide_bits", np.unpackbits(out).reshape(rounds, lanes))
+        out = out[:-(-n // 8)]
+        if n % 8:
+            out[-1] &= (0xFF << (8 - n % 8)) & 0xFF
+        return out
+
+    def decide_bytes(self, n, lanes=1024):
+        return self.decide_bits(8 * n, lanes).tobytes()
+
+    def _lane_bank(self, lanes):
+        if self._qrng_pending is not None:
+            self._mix_qrng()
+        with self._qrng_lock:
+            if self._lanes is None or self._lanes.n != lanes:
+                if self.fixed_point:
+                    self._lanes = FixedPointEnsemble(lanes, self.a, self.b, self.c, self.dt,
+                                                     seed=_lane_seed(self._seed_seq, lanes))
+                else:
+                    self._lanes = NIHDEEnsemble(lanes, self.system, self.integrator, self.dt,
+                                                seed=_lane_seed(self._seed_seq, lanes), **self.param_values())
+                self._lanes.step(1000)
+            return self._lanes
+
+    def raw_samples(self, n, lanes=1024, steps=10):
+        # n raw state words from the lane bank (float64, or int64 in
+        # fixed-point mode), `steps` integration steps apart; input for
+        # core.chaos.extractor.
+        bank = self._lane_bank(lanes)
+        width = lanes * self.system.dim
+        rounds = -(-n // width)
+        out = np.empty(rounds * width, dtype=bank.state.dtype)
+        for r in range(rounds):
+            bank.step(steps)
+            if not self.fixed_point:
+                bank.reseed_diverged()
+            out[r * width:(r + 1) * width] = bank.state.ravel()
+        if self.health is not None:
+            self.health.feed("raw_samples", out.reshape(rounds, width))
+        return out[:n]
+
+    def mantissa_bits(self, n, bits_per_sample=8, skip=2, lanes=1024, steps=1):
+        m = self.metrics
+        if m is not None:
+            t0 = perf_counter_ns() if m.timing else None
+            out = self._mantissa_bits(n, bits_per_sample, skip, lanes, steps)
+            m.record("mantissa_bits", None if t0 is None else perf_counter_ns() - t0, n)
+            return out
+        return self._mantissa_bits(n, bits_per_sample, skip, lanes, steps)
+
+    def _mantissa_bits(self, n, bits_per_sample, skip, lanes, steps):
+        # Takes `bits_per_sample` low mantissa bits of every state coordinate
+        # after each `steps` integration steps, through a uint64 view of the
+        # raw samples; one step yields lanes * dim * k bits. The lowest `skip`
+        # bits are dropped: round-to-nearest-even biases bit 0 (about 0.487
+        # ones) and measurably bit 1. Packed like decide_bits(). In
+        # fixed-point mode the bits are the low fractional bits instead.
+        k = bits_per_sample
+        if self.fixed_point:
+            if k < 1 or skip < 0 or k + skip > FRAC_BITS:
+                raise ValueError(f"bits_per_sample + skip must fit the {FRAC_BITS} fraction bits")
+        elif k < 1 or skip < 0 or k + skip > 52:
+            raise ValueError("bits_per_sample + skip must fit the 52-bit mantissa")
+        words = self.raw_samples(-(-n // k), lanes, steps).view(np.uint64) >> np.uint64(skip)
+        if k % 8 == 0:
+            # Little-endian low bytes, most significant of them first.
+            out = words.view(np.uint8).reshape(-1, 8)[:, k // 8 - 1::-1].ravel()
+            out = out[:-(-n // 8)].copy()
+        else:
+            shifts = np.arange(k - 1, -1, -1, dtype=np.uint64)
+            bits = ((words[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+            out = np.packbits(bits.ravel()[:n])
+        if n % 8:
+            out[-1] &= (0xFF << (8 - n % 8)) & 0xFF
+        return out
+
+    def extract_bytes(self, n, ratio=2.0, min_entropy=None, lanes=1024, source="mantissa"):
+        # Conditioned output; see core.chaos.extractor.Extractor.
+        m = self.metrics
+        t0 = perf_counter_ns() if m is not None and m.timing else None
+        out = Extractor(self, ratio=ratio, min_entropy=min_entropy, lanes=lanes, source=source).read(n)
+        if m is not None:
+            m.record("extract_bytes", None if t0 is None else perf_counter_ns() - t0, 8 * n)
+        return out
+
+    def _fill(self, buf):
+        # Advance len(buf) steps, writing each state into the C-contiguous
+        # (k, d) float64 or float32 buffer in place. The state itself always
+        # accumulates in float64; only the stored copy is rounded. A flat
+        # memoryview keeps the Euler loop on plain floats without a temporary
+        # list per row.
+        if self._qrng_pending is not None:
+            self._mix_qrng()
+        self.step_count += len(buf)
+        if self.fixed_point:
+            self._fixed_steps(len(buf), memoryview(buf.reshape(-1)))
+            return buf
+        if not self._fast:
+            s = self.state
+            for i in range(len(buf)):
+                s = self._integrator.step(self._derivative, s, self._params())
+                buf[i] = s
+            self.state = s
+            return buf
+        flat = memoryview(buf.reshape(-1))
+        s = self.state
+        x, y, z = float(s[0]), float(s[1]), float(s[2])
+        a, b, c, dt = self.a, self.b, self.c, self.dt
+        for i in range(0, 3 * len(buf), 3):
+            x, y, z = x + dt * (-y - z), y + dt * (x + a * y), z + dt * (b + z * (x - c))
+            flat[i] = x
+            flat[i + 1] = y
+            flat[i + 2] = z
+        s[0], s[1], s[2] = x, y, z
+        return buf
+
+    def iter_attractor(self, steps=None, chunk_size=65536, dtype=np.float64):
+        # Yields (k, d) chunks of the trajectory, k <= chunk_size. The same
+        # preallocated buffer is reused for every chunk, so memory stays
+        # constant; copy a chunk if it must outlive the next iteration.
+        buf = np.empty((chunk_size, self.system.dim), dtype=dtype)
+        done = 0
+        while steps is None or done < steps:
+            k = chunk_size if steps is None else min(chunk_size, steps - done)
+            yield self._fill(buf[:k])
+            done += k
+
+    def get_attractor(self, steps=15000, dtype=np.float64):
+        return self._fill(np.empty((steps, self.system.dim), dtype=dtype))
+
+    def save_attractor(self, path, steps, chunk_size=65536, dtype=np.float64):
+        # Streams the trajectory straight into a memory-mapped archive, see
+        # core.chaos.trajectory; the whole run is never held in memory. The
+        # header's dt is the row spacing, so adaptive steps are rejected.
+        if self.integrator == "dopri5":
+            raise ValueError("save_attractor needs a fixed-step integrator")
+        traj = create_trajectory(path, steps, dim=self.system.dim, dtype=dtype, system=self.system.name,
+                                 params=self.param_values(), seed=self.seed,
+                                 spawn_key=list(self._seed_seq.spawn_key),
+                                 dt=self.dt, integrator=self.integrator)
+        for start in range(0, steps, chunk_size):
+            self._fill(traj.data[start:start + chunk_size])
+        traj.flush()
+        return traj
+
+    def snapshot(self, path=None):
+        # Layout: magic, uint32 header length, JSON header (state, parameters,
+        # RNG and SeedSequence state, step count), then the decide_bits lanes
+        # as raw little-endian float64 (state rows, then one column per
+        # parameter) if present; fixed-point lanes are int64 state rows and
+        # the c column, with the scalar parameters in the header.
+        meta = {"system": self.system.name, "state": self.state.tolist(),
+                "params": self.param_values(),
+                "param_table": None if self.param_table is None else self.param_table.tolist(),
+                "step_count": self.step_count, "integrator": self.integrator,
+                "dt": self._integrator.dt, "seed": _seed_state(self._seed_seq),
+                "rng": self.rng.bit_generator.state, "qrng_seed": self.qrng_seed,
+                "qrng_source": self.qrng_source, "qrng_step": self.qrng_step,
+                "fixed_point": self.fixed_point, "lanes": None}
+        body = b""
+        if isinstance(self._lanes, FixedPointEnsemble):
+            lanes = self._lanes
+            meta["lanes"] = {"n": lanes.n, "frac_bits": lanes.frac_bits, "a": int(lanes.a), "b": int(lanes.b),
+                             "dt": int(lanes.dt), "step_count": lanes.step_count,
+                             "seed": _seed_state(lanes._seed_seq), "rng": lanes.rng.bit_generator.state}
+            body = np.asarray(lanes.state, dtype="<i8").tobytes() + np.asarray(lanes.c, dtype="<i8").tobytes()
+        elif self._lanes is not None:
+            lanes = self._lanes
+            meta["lanes"] = {"n": lanes.n, "dt": lanes._integrator.dt, "step_count": lanes.step_count,
+                             "seed": _seed_state(lanes._seed_seq),
+                             "rng": lanes.rng.bit_generator.state}
+            body = b"".join(np.asarray(v, dtype="<f8").tobytes()
+                            for v in [lanes.state] + [getattr(lanes, k) for k in lanes.param_names])
+        header = json.dumps(meta).encode()
+        blob = SNAPSHOT_MAGIC + struct.pack("<I", len(header)) + header + body
+        if path is not None:
+            with open(path, "wb") as f:
+                f.write(blob)
+        return blob
+
+    @classmethod
+    def restore(cls, blob):
+        # Accepts the bytes from snapshot() or a path to a snapshot file.
+        if isinstance(blob, (str, os.PathLike)):
+            with open(blob, "rb") as f:
+                blob = f.read()
+        if blob[:8] != SNAPSHOT_MAGIC:
+            raise ValueError("not an NIHDE snapshot")
+        (length,) = struct.unpack_from("<I", blob, 8)
+        meta = json.loads(blob[12:12 + length])
+
+        self = cls.__new__(cls)
+        self.fixed_point = meta.get("fixed_point", False)
+        self._setup(meta["system"], meta["integrator"], meta["dt"])
+        self.state = np.array(meta["state"], dtype=np.float64)
+        for name, value in meta["params"].items():
+            setattr(self, name, value)
+        self.param_table = None if meta["param_table"] is None else np.array(meta["param_table"])
+        self.step_count = meta["step_count"]
+        self._seed_seq = _restore_seed(meta["seed"])
+        self.seed = self._seed_seq.entropy
+        self.rng = _restore_rng(meta["rng"])
+        self.qrng_seed = meta.get("qrng_seed")
+        self.qrng_source = meta.get("qrng_source")
+        self.qrng_step = meta.get("qrng_step")
+        self._qrng_pending = None
+        self._qrng_lock = threading.RLock()
+        self._qrng = None
+        self._lanes = None
+        self._prefetch = None
+        self.metrics = None
+        self.health = None
+
+        if meta["lanes"] is not None and self.fixed_point:
+            info = meta["lanes"]
+            n = info["n"]
+            body = np.frombuffer(blob, dtype="<i8", offset=12 + length).astype(np.int64)
+            lanes = FixedPointEnsemble.__new__(FixedPointEnsemble)
+            lanes.n = n
+            lanes._setup(info["frac_bits"])
+            lanes.state = body[:3 * n].reshape(n, 3)
+            lanes.c = body[3 * n:4 * n].copy()
+            lanes.a, lanes.b, lanes.dt = info["a"], info["b"], info["dt"]
+            lanes.step_count = info["step_count"]
+            lanes._seed_seq = _restore_seed(info["seed"])
+            lanes.seed = lanes._seed_seq.entropy
+            lanes.rng = _restore_rng(info["rng"])
+            self._lanes = lanes
+        elif meta["lanes"] is not None:
+            info = meta["lanes"]
+            n, d = info["n"], self.system.dim
+            body = np.frombuffer(blob, dtype="<f8", offset=12 + length).astype(np.float64)
+            lanes = NIHDEEnsemble.__new__(NIHDEEnsemble)
+            lanes.n = n
+            lanes._setup(self.system, self.integrator, info["dt"])
+            lanes.state = body[:n * d].reshape(n, d)
+            for i, name in enumerate(lanes.param_names):
+                setattr(lanes, name, body[n * (d + i):n * (d + i + 1)])
+            lanes.step_count = info["step_count"]
+            lanes._seed_seq = _restore_seed(info["seed"])
+            lanes.seed = lanes._seed_seq.entropy
+            lanes.rng = _restore_rng(info["rng"])
+            self._lanes = lanes
+        return self
+
+
+class NIHDEEnsemble:
+    # N independent trajectories of one chaotic system advanced together as
+    # an (N, d) array. Parameters not given as keywords use the system's
+    # defaults and jitter; each is stored as an (N,) array.
+    def __init__(self, n, system="rossler", integrator="euler", dt=None, seed=None, **params):
+        self.n = int(n)
+        self._setup(system, integrator, dt)
+        unknown = set(params) - set(self.param_names)
+        if unknown:
+            raise ValueError(f"Unknown parameters for {self.system.name}: {', '.join(sorted(unknown))}")
+        self._seed_seq = _seed_sequence(seed)
+        self.seed = self._seed_seq.entropy
+        self.rng = np.random.default_rng(self._seed_seq)
+        self.state = self.system.initial(self.rng, self.n)
+        self.step_count = 0
+        values = self.system.sample_params(self.rng, self.n)
+        values.update(params)
+        for name in self.param_names:
+            setattr(self, name, np.broadcast_to(np.asarray(values[name], dtype=np.float64), (self.n,)).copy())
+
+    def _setup(self, system, integrator, dt):
+        self.system = get_system(system)
+        self.param_names = list(self.system.params)
+        self.integrator = integrator
+        self._integrator = _make_integrator(self.system, integrator, dt)
+        self.dt = self._integrator.dt
+
+    @property
+    def x(self):
+        return self.state[:, 0]
+
+    @property
+    def y(self):
+        return self.state[:, 1]
+
+    @property
+    def z(self):
+        return self.state[:, 2]
+
+    def param_values(self):
+        return {name: getattr(self, name) for name in self.param_names}
+
+    def _params(self):
+        return [getattr(self, name) for name in self.param_names]
+
+    def _derivative(self, s):
+        return self.system.rhs(s, *self._params())
+
+    def step(self, steps=1):
+        self.step_count += steps
+        for _ in range(steps):
+            self.state = self._integrator.step(self._derivative, self.state, self._params())
+
+    def record(self, steps, every=1, dtype=np.float32):
+        # (steps // every, N, d) history of the ensemble, sampled every
+        # `every` steps. Integration stays float64; the stored copy uses
+        # dtype, so float32 halves the footprint of large ensembles.
+        out = np.empty((steps // every, self.n, self.system.dim), dtype=dtype)
+        for i in range(len(out)):
+            self.step(every)
+            out[i] = self.state
+        return out
+
+    def reseed_diverged(self):
+        # Lanes that left the attractor (inf/NaN) would turn into constant
+        # bits; they restart from fresh initial states drawn from self.rng,
+        # keeping their parameters. Returns the number of lanes restarted.
+        bad = ~np.isfinite(self.state).all(axis=1)
+        k = int(np.count_nonzero(bad))
+        if k:
+            self.state[bad] = self.system.initial(self.rng, k)
+            warnings.warn(f"{k} of {self.n} {self.system.name} lanes diverged and were re-seeded",
+                          RuntimeWarning)
+        return k
 
     def decide(self):
-        for _ in range(10):
-            self._step()
-        return int(self.z * 1000) % 2
-
-    def get_attractor(self, steps=15000):
-        traj = np.zeros((steps, 3))
-        for i in range(steps):
-            self._step()
-            traj[i] = [self.x, self.y, self.z]
-        return traj
\ No newline at end of file
+        # Same rule as NIHDE.decide(), one bit per trajectory.
+        self.step(10)
+        self.reseed_diverged()
+        return ((self.state[:, self.system.bit_axis] * 1000).astype(np.int64) & 1).astype(np.uint8)
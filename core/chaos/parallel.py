@@ -0,0 +1,61 @@
+# core/chaos/parallel.py
+# Aether v2.0 – Multi-process sharded bit generation
+#
+# The output is split into fixed-size shards, each produced by its own NIHDE
+# spawned from the root SeedSequence. Workers write straight into one shared
+# memory buffer at their shard's offset, so the result for a given root seed
+# does not depend on the number of workers or on completion order.
+# Callers on spawn-based platforms (Windows, macOS) need the usual
+# `if __name__ == "__main__":` guard around generate_bits().
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from core.chaos.nihde import NIHDE
+
+SHARD_BITS = 1 << 23
+
+
+def _fill_shard(shm_name, total_bytes, offset, nbits, seed, system, integrator, dt, lanes):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((total_bytes,), dtype=np.uint8, buffer=shm.buf)
+        engine = NIHDE(use_live_qrng=False, integrator=integrator, dt=dt, seed=seed, system=system)
+        chunk = engine.decide_bits(nbits, lanes)
+        out[offset:offset + len(chunk)] = chunk
+        del out
+    finally:
+        shm.close()
+
+
+def generate_bits(n, workers=None, seed=None, system="rossler", integrator="euler", dt=None,
+                  lanes=1024, shard_bits=SHARD_BITS):
+    # Returns ceil(n / 8) packed bytes like NIHDE.decide_bits(). seed=None
+    # uses fresh OS entropy; pass an int or SeedSequence to reproduce a run.
+    if shard_bits % 8:
+        raise ValueError("shard_bits must be a multiple of 8")
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    total_bytes = -(-n // 8)
+    starts = range(0, n, shard_bits)
+    children = root.spawn(len(starts))
+    workers = workers or os.cpu_count() or 1
+
+    shm = shared_memory.SharedMemory(create=True, size=max(total_bytes, 1))
+    try:
+        jobs = [(shm.name, total_bytes, start // 8, min(shard_bits, n - start), child,
+                 system, integrator, dt, lanes)
+                for start, child in zip(starts, children)]
+        if workers == 1:
+            for job in jobs:
+                _fill_shard(*job)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for future in [pool.submit(_fill_shard, *job) for job in jobs]:
+                    future.result()
+        return np.ndarray((total_bytes,), dtype=np.uint8, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,196 @@
+# core/chaos/pool.py
+# Aether v2.0 – Persistent on-disk QRNG entropy pool
+# One large ANU request fills ~/.cache/aether/qrng.pool; every engine start
+# then takes 32 bytes from it locally. take() reads the tail of the file and
+# truncates it under an exclusive file lock, so bytes are consumed exactly
+# once across threads and processes; a crash between read and truncate can
+# only lose bytes, never hand them out twice. A background refiller tops the
+# pool up whenever it drops below low_water. Only full ANU batches go into the
+# pool; when it cannot serve a seed, pool_seed() falls back to a hedged
+# EntropySelector (ANU and the drand beacon by default), whose answers are
+# used once and never stored.
+
+import os
+import threading
+from contextlib import contextmanager
+
+from core.chaos.qrng import fetch_anu_bytes
+from core.chaos.sources import EntropySelector
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "aether")
+SEED_BYTES = 32
+SEED_SOURCES = ("anu", "drand")
+
+
+class EntropyPool:
+    def __init__(self, path=None, batch=1 << 16, low_water=1 << 13, max_size=1 << 20,
+                 fetch=fetch_anu_bytes, retry=30.0):
+        self.path = path or os.path.join(CACHE_DIR, "qrng.pool")
+        self.batch = batch
+        self.low_water = low_water
+        self.max_size = max_size
+        self.fetch = fetch
+        self.retry = retry
+        self.error = None
+        self._mutex = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._stop = False
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+
+    @contextmanager
+    def _locked(self):
+        # Thread lock inside the process, advisory file lock across processes.
+        with self._mutex:
+            fd = os.open(self.path + ".lock", os.O_CREAT | os.O_RDWR, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                yield
+            finally:
+                if fcntl is None:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                os.close(fd)
+
+    def size(self):
+        return os.path.getsize(self.path)
+
+    def take(self, n):
+        # n bytes removed from the pool, or None if it holds fewer than n.
+        with self._locked():
+            with open(self.path, "r+b") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size < n:
+                    out = None
+                else:
+                    f.seek(size - n)
+                    out = f.read(n)
+                    f.truncate(size - n)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    size -= n
+        if size < self.low_water:
+            self._wake.set()
+        return out
+
+    def add(self, data):
+        # Appends fresh bytes, up to max_size; returns the number kept.
+        with self._locked():
+            with open(self.path, "ab") as f:
+                keep = max(0, min(len(data), self.max_size - f.tell()))
+                f.write(data[:keep])
+                f.flush()
+                os.fsync(f.fileno())
+        return keep
+
+    def refill(self, timeout=5):
+        # One network round trip of `batch` bytes; short answers are rejected
+        # so a partial batch never passes for a refill.
+        data = self.fetch(self.batch, timeout=timeout)
+        if len(data) < self.batch:
+            raise ValueError(f"partial refill rejected ({len(data)} of {self.batch} bytes)")
+        return self.add(data)
+
+    def seed(self, timeout=5):
+        # A 256-bit integer seed; fetches a batch first only if the pool
+        # is empty.
+        data = self.take(SEED_BYTES)
+        if data is None:
+            self.refill(timeout)
+            data = self.take(SEED_BYTES)
+            if data is None:
+                raise ValueError("entropy pool could not be refilled")
+        return int.from_bytes(data, "big")
+
+    def start_refill(self):
+        if self._thread is None:
+            self._stop = False
+            self._wake.set()
+            self._thread = threading.Thread(target=self._run, name="aether-pool", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop_refill(self):
+        if self._thread is not None:
+            self._stop = True
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._stop:
+                return
+            if self.size() >= self.low_water:
+                continue
+            try:
+                self.refill()
+                self.error = None
+            except Exception as e:
+                self.error = e
+                self._wake.wait(self.retry)
+                self._wake.set()
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_pool():
+    # Shared pool at the default path, refilled from ANU only.
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = EntropyPool().start_refill()
+    return _default
+
+
+_selector = None
+
+
+def seed_selector():
+    # Selector behind pool_seed()'s fallback; one shared instance, so its
+    # health and latency statistics carry over between engines.
+    global _selector
+    with _default_lock:
+        if _selector is None:
+            _selector = EntropySelector(SEED_SOURCES)
+    return _selector
+
+
+def set_seed_selector(selector):
+    # Replaces the fallback selector; takes an EntropySelector or a list of
+    # sources (names or EntropySource objects).
+    global _selector
+    if not isinstance(selector, EntropySelector):
+        selector = EntropySelector(selector)
+    with _default_lock:
+        _selector = selector
+    return selector
+
+
+def pool_seed(timeout=5, selector=None):
+    # (seed, source label). When the pool is empty and ANU cannot refill it,
+    # the seed comes from whichever source of the selector answers first.
+    # Public sources (the drand beacon) are labelled as such; nothing from
+    # this path enters the pool.
+    try:
+        return default_pool().seed(timeout), "ANU entropy pool"
+    except Exception:
+        data, source = (selector or seed_selector()).fetch_source(SEED_BYTES, timeout)
+        if len(data) < SEED_BYTES:
+            raise ValueError(f"entropy source '{source.name}' returned {len(data)} of {SEED_BYTES} seed bytes")
+        kind = "public, fallback" if source.public else "fallback"
+        return int.from_bytes(data[:SEED_BYTES], "big"), f"{source.name} ({kind})"
@@ -0,0 +1,78 @@
+# core/chaos/prefetch.py
+# Aether v2.0 – Background prefetch ring buffer for decisions
+# A worker thread refills a preallocated uint8 ring in bulk whenever the fill
+# level drops to the low-water mark; pop() is one index into the ring. The
+# ring is single-producer / single-consumer: the worker only writes the free
+# region past `tail`, the consumer only reads between `head` and `tail`.
+# If produce() raises, the worker stops and pop() re-raises that error once
+# the decisions already in the ring are used up.
+
+import threading
+
+import numpy as np
+
+
+class Prefetcher:
+    def __init__(self, produce, capacity=1 << 16, low_water=None):
+        # produce(n) must return n decisions as a uint8 array.
+        self.produce = produce
+        self.capacity = capacity
+        self.low_water = capacity // 4 if low_water is None else low_water
+        self.buf = np.empty(capacity, dtype=np.uint8)
+        self.head = 0       # total decisions consumed
+        self.tail = 0       # total decisions produced
+        self._cond = threading.Condition()
+        self._stop = False
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="nihde-prefetch", daemon=True)
+        self._thread.start()
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stop and self.tail - self.head > self.low_water:
+                    self._cond.wait()
+                if self._stop:
+                    return
+                free = self.capacity - (self.tail - self.head)
+                start = self.tail % self.capacity
+            try:
+                chunk = self.produce(free)
+            except BaseException as e:
+                with self._cond:
+                    self.error = e
+                    self._stop = True
+                    self._cond.notify_all()
+                return
+            first = min(free, self.capacity - start)
+            self.buf[start:start + first] = chunk[:first]
+            self.buf[:free - first] = chunk[first:]
+            with self._cond:
+                self.tail += free
+                self._cond.notify_all()
+
+    def pop(self):
+        if self.tail == self.head:
+            with self._cond:
+                while self.tail == self.head:
+                    if self.error is not None:
+                        raise self.error
+                    if self._stop:
+                        raise RuntimeError("prefetcher stopped")
+                    self._cond.notify_all()
+                    self._cond.wait()
+        bit = int(self.buf[self.head % self.capacity])
+        self.head += 1
+        if self.tail - self.head == self.low_water:
+            with self._cond:
+                self._cond.notify_all()
+        return bit
+
+    def stop(self):
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        self._thread.join()
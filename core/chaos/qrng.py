@@ -0,0 +1,63 @@
+# core/chaos/qrng.py
+# Aether v2.0 – Live QRNG seed material
+# Engines never wait on the network: NIHDE starts from OS entropy and a
+# QRNGSeeder thread delivers the quantum seed whenever it arrives.
+
+import hashlib
+import threading
+
+import numpy as np
+
+from core.chaos.session import default_session
+
+ANU_URL = "https://qrng.anu.edu.au/API/jsonI.php?length=10&type=uint16"
+ANU_HEX_URL = "https://qrng.anu.edu.au/API/jsonI.php?length={length}&type=hex16&size={size}"
+
+
+def fetch_anu(timeout=5, session=None):
+    # 10 uint16 values from ANU, hashed to a 256-bit integer seed.
+    payload = (session or default_session()).get_json(ANU_URL, timeout)
+    if not payload.get("success"):
+        raise ValueError("ANU QRNG request failed")
+    data = np.array(payload["data"])
+    return int(hashlib.sha256(data.tobytes()).hexdigest(), 16)
+
+
+def fetch_anu_bytes(n, timeout=5, url=ANU_HEX_URL, session=None):
+    # Up to n raw bytes in one request, as hex16 blocks of 1024 values
+    # (2 KiB each, at most 1024 blocks).
+    length = max(1, min(1024, -(-n // 2048)))
+    payload = (session or default_session()).get_json(url.format(length=length, size=1024), timeout)
+    if not payload.get("success"):
+        raise ValueError("ANU QRNG request failed")
+    return bytes.fromhex("".join(payload["data"]))[:n]
+
+
+class QRNGSeeder:
+    # Runs fetch() once on a daemon thread and hands its result (the seed,
+    # or whatever the given fetch returns) to callback(); a failure is kept
+    # in `error` and passed to on_error.
+    def __init__(self, callback, on_error=None, fetch=fetch_anu, timeout=5):
+        self.callback = callback
+        self.on_error = on_error
+        self.fetch = fetch
+        self.timeout = timeout
+        self.seed = None
+        self.error = None
+        self.done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="nihde-qrng", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            self.seed = self.fetch(timeout=self.timeout)
+            self.callback(self.seed)
+        except Exception as e:
+            self.error = e
+            if self.on_error is not None:
+                self.on_error(e)
+        finally:
+            self.done.set()
+
+    def wait(self, timeout=None):
+        return self.done.wait(timeout)
@@ -0,0 +1,121 @@
+# core/chaos/session.py
+# Aether v2.0 – Pooled HTTP session for QRNG and beacon fetches
+# One requests.Session with a sized keep-alive pool serves every fetch, so a
+# reseed costs one pooled request instead of a fresh TCP+TLS handshake.
+# Connection errors, timeouts, 429 and 5xx answers are retried with
+# full-jitter exponential backoff; a per-host circuit breaker stops calling a
+# host after repeated failed fetches until its reset time has passed.
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitBreaker:
+    # closed -> open after `failures` failed fetches in a row; after `reset`
+    # seconds one trial fetch is let through (half-open), and its outcome
+    # closes or re-opens the circuit.
+    def __init__(self, failures=5, reset=30.0):
+        self.failures = failures
+        self.reset = reset
+        self.count = 0
+        self.opened = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened >= self.reset else "open"
+
+    def allow(self):
+        with self._lock:
+            if self.opened is None:
+                return True
+            if self._trial or time.monotonic() - self.opened < self.reset:
+                return False
+            self._trial = True
+            return True
+
+    def success(self):
+        with self._lock:
+            self.count = 0
+            self.opened = None
+            self._trial = False
+
+    def failure(self):
+        with self._lock:
+            self.count += 1
+            if self._trial or self.count >= self.failures:
+                self.opened = time.monotonic()
+            self._trial = False
+
+
+class QRNGSession:
+    def __init__(self, pool_size=4, retries=3, backoff=0.2, max_backoff=5.0,
+                 breaker_failures=5, breaker_reset=30.0):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker_failures = breaker_failures
+        self.breaker_reset = breaker_reset
+        self.breakers = {}
+        self.requests = 0
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._lock = threading.Lock()
+
+    def breaker(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(self.breaker_failures, self.breaker_reset)
+            return self.breakers[host]
+
+    def _delay(self, attempt):
+        return random.uniform(0, min(self.max_backoff, self.backoff * (1 << attempt)))
+
+    def get_json(self, url, timeout=5):
+        # Decoded JSON body of GET url. Raises RuntimeError while the host's
+        # circuit is open, otherwise the last error once retries run out.
+        breaker = self.breaker(url)
+        if not breaker.allow():
+            raise RuntimeError(f"circuit open for {urlsplit(url).netloc}")
+        for attempt in range(self.retries + 1):
+            try:
+                self.requests += 1
+                r = self.session.get(url, timeout=timeout)
+                r.raise_for_status()
+                payload = r.json()
+                breaker.success()
+                return payload
+            except (requests.RequestException, ValueError) as e:
+                retry = not isinstance(e, requests.HTTPError) or e.response.status_code in RETRY_STATUS
+                if attempt == self.retries or not retry:
+                    breaker.failure()
+                    raise
+                time.sleep(self._delay(attempt))
+
+    def close(self):
+        self.session.close()
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_session():
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = QRNGSession()
+    return _default
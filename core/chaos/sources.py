@@ -0,0 +1,239 @@
+# core/chaos/sources.py
+# Aether v2.0 – Pluggable entropy sources with hedged, health-ranked fetching
+#
+# An EntropySource returns up to n fresh bytes per fetch(n, timeout). The
+# EntropySelector ranks sources by health and median latency, starts the
+# best one and, if it has not answered after hedge_delay seconds, races the
+# next one against it (up to `hedge` requests in flight); the first good
+# answer wins. A source that fails max_failures times in a row is benched
+# for `cooldown` seconds and then probed again.
+
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from time import perf_counter_ns
+
+from core.chaos.metrics import LatencyHistogram
+from core.chaos.qrng import ANU_HEX_URL, fetch_anu_bytes
+from core.chaos.session import default_session
+
+DRAND_URL = "https://drand.cloudflare.com"
+
+
+class EntropySource:
+    name = "source"
+    public = False
+
+    def fetch(self, n, timeout=5):
+        raise NotImplementedError
+
+
+class ANUSource(EntropySource):
+    name = "anu"
+
+    def __init__(self, url=ANU_HEX_URL, name=None, session=None):
+        self.url = url
+        self.name = name or self.name
+        self.session = session
+
+    def fetch(self, n, timeout=5):
+        return fetch_anu_bytes(n, timeout, self.url, self.session)
+
+
+class BeaconSource(EntropySource):
+    # drand-style public randomness beacon (Cloudflare's drand mirror by
+    # default). One round is 32 bytes, so at most 32 bytes per fetch. The
+    # value is public: only use it mixed with local entropy, as NIHDE does.
+    name = "drand"
+    public = True
+
+    def __init__(self, url=DRAND_URL, name=None, session=None):
+        self.url = url.rstrip("/")
+        self.name = name or self.name
+        self.session = session
+
+    def fetch(self, n, timeout=5):
+        payload = (self.session or default_session()).get_json(self.url + "/public/latest", timeout)
+        randomness = bytes.fromhex(payload["randomness"])
+        if len(randomness) != 32:
+            raise ValueError("beacon returned malformed randomness")
+        return randomness[:n]
+
+
+class OSSource(EntropySource):
+    name = "urandom"
+
+    def fetch(self, n, timeout=5):
+        return os.urandom(n)
+
+
+class FileSource(EntropySource):
+    # Reads sequentially from a file, device or FIFO (e.g. /dev/hwrng or a
+    # pipe fed by an external QRNG); the handle stays open between fetches.
+    def __init__(self, path, name=None):
+        self.path = path
+        self.name = name or f"file:{path}"
+        self._file = None
+        self._lock = threading.Lock()
+
+    def fetch(self, n, timeout=5):
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "rb")
+            data = self._file.read(n)
+        if not data:
+            raise ValueError(f"entropy file '{self.path}' is exhausted")
+        return data
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SourceStats:
+    def __init__(self):
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.bytes = 0
+        self.last_error = None
+        self.last_failure = None
+        self.latency = LatencyHistogram()
+        self._lock = threading.Lock()
+
+    def success(self, ns, nbytes):
+        with self._lock:
+            self.calls += 1
+            self.successes += 1
+            self.consecutive_failures = 0
+            self.bytes += nbytes
+            self.latency.record(ns)
+
+    def failure(self, error):
+        with self._lock:
+            self.calls += 1
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = repr(error)
+            self.last_failure = time.monotonic()
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "successes": self.successes,
+                "failures": self.failures,
+                "consecutive_failures": self.consecutive_failures,
+                "bytes": self.bytes,
+                "last_error": self.last_error,
+                "latency": self.latency.to_dict(),
+            }
+
+
+class EntropySelector:
+    def __init__(self, sources, hedge=2, hedge_delay=0.25, max_failures=3, cooldown=60.0):
+        self.sources = [get_source(s) for s in sources]
+        if not self.sources:
+            raise ValueError("EntropySelector needs at least one source")
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.stats = {s.name: SourceStats() for s in self.sources}
+
+    def healthy(self, source):
+        st = self.stats[source.name]
+        if st.consecutive_failures < self.max_failures:
+            return True
+        return time.monotonic() - st.last_failure >= self.cooldown
+
+    def ranked(self):
+        # Healthy sources: fewest recent failures first, untried before
+        # measured ones, then by median latency; ties keep the given order.
+        def key(s):
+            st = self.stats[s.name]
+            return (st.consecutive_failures, st.latency.total > 0, st.latency.percentile(50))
+        return sorted((s for s in self.sources if self.healthy(s)), key=key)
+
+    def _call(self, source, n, timeout):
+        t0 = perf_counter_ns()
+        try:
+            data = source.fetch(n, timeout)
+            if not data:
+                raise ValueError(f"entropy source '{source.name}' returned no data")
+        except Exception as e:
+            self.stats[source.name].failure(e)
+            raise
+        self.stats[source.name].success(perf_counter_ns() - t0, len(data))
+        return data
+
+    def _submit(self, source, n, timeout):
+        # Each request runs on its own daemon thread, so a losing request
+        # that is still waiting on the network never delays interpreter exit
+        # (ThreadPoolExecutor workers are joined at shutdown).
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(self._call(source, n, timeout))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"aether-source-{source.name}", daemon=True).start()
+        return future
+
+    def fetch(self, n, timeout=5):
+        # Up to n bytes from the first source to answer; losing requests
+        # finish in the background and still update their statistics.
+        return self.fetch_source(n, timeout)[0]
+
+    def fetch_source(self, n, timeout=5):
+        # As fetch(), but returns (data, source) so the caller can tell
+        # which source answered.
+        ranked = self.ranked()
+        if not ranked:
+            raise ValueError("no healthy entropy source")
+        pending = {}
+        errors = []
+        i = 0
+        while pending or i < len(ranked):
+            if i < len(ranked) and len(pending) < self.hedge:
+                pending[self._submit(ranked[i], n, timeout)] = ranked[i]
+                i += 1
+            more = i < len(ranked) and len(pending) < self.hedge
+            done, _ = wait(pending, timeout=self.hedge_delay if more else None,
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                source = pending.pop(future)
+                if future.exception() is None:
+                    return future.result(), source
+                errors.append(f"{source.name}: {future.exception()!r}")
+        raise ValueError("all entropy sources failed (" + "; ".join(errors) + ")")
+
+    def to_dict(self):
+        return {name: st.to_dict() for name, st in self.stats.items()}
+
+
+SOURCES = {}
+
+
+def register_source(source):
+    SOURCES[source.name] = source
+    return source
+
+
+def get_source(source):
+    if isinstance(source, EntropySource):
+        return source
+    if source not in SOURCES:
+        raise ValueError(f"Unknown entropy source '{source}' (choose from {', '.join(SOURCES)})")
+    return SOURCES[source]
+
+
+register_source(ANUSource())
+register_source(BeaconSource())
+register_source(OSSource())
+
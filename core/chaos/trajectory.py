@@ -0,0 +1,64 @@
+# core/chaos/trajectory.py
+# Aether v2.0 – On-disk trajectory archive opened through np.memmap
+#
+# Layout: 8-byte magic, uint32 little-endian header length and a JSON header,
+# space-padded to a fixed 512 bytes. The raw (rows, dim) body follows as
+# C-ordered little-endian float64 or float32.
+
+import json
+import struct
+import numpy as np
+
+MAGIC = b"AETHTRJ1"
+HEADER_SIZE = 512
+
+
+class Trajectory:
+    def __init__(self, path, meta, data):
+        self.path = path
+        self.meta = meta
+        self.data = data
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def flush(self):
+        self.data.flush()
+
+
+def _write_header(f, meta):
+    body = json.dumps(meta, sort_keys=True).encode()
+    if len(body) > HEADER_SIZE - 12:
+        raise ValueError("trajectory header too large")
+    f.write(MAGIC + struct.pack("<I", len(body)) + body.ljust(HEADER_SIZE - 12, b" "))
+
+
+def _read_header(f):
+    head = f.read(12)
+    if head[:8] != MAGIC:
+        raise ValueError("not an Aether trajectory file")
+    (length,) = struct.unpack("<I", head[8:])
+    return json.loads(f.read(length))
+
+
+def create_trajectory(path, rows, dim=3, dtype=np.float64, **meta):
+    dtype = np.dtype(np.dtype(dtype).newbyteorder("<").str)
+    if dtype.kind != "f":
+        raise ValueError("trajectory dtype must be float32 or float64")
+    meta = dict(meta, rows=int(rows), dim=int(dim), dtype=dtype.str)
+    with open(path, "wb") as f:
+        _write_header(f, meta)
+        f.truncate(HEADER_SIZE + int(rows) * int(dim) * dtype.itemsize)
+    data = np.memmap(path, dtype=dtype, mode="r+", offset=HEADER_SIZE, shape=(int(rows), int(dim)))
+    return Trajectory(path, meta, data)
+
+
+def open_trajectory(path, mode="r"):
+    with open(path, "rb") as f:
+        meta = _read_header(f)
+    data = np.memmap(path, dtype=np.dtype(meta["dtype"]), mode=mode,
+                     offset=HEADER_SIZE, shape=(meta["rows"], meta.get("dim", 3)))
+    return Trajectory(path, meta, data)
@@ -14,7 +14,7 @@ print("=" * 90)
 
 # Start quantum-seeded engine
 engine = NIHDE(use_live_qrng=True)
-time.sleep(1)
+engine.start_prefetch()
 
 # Live decision stream
 print("\nLive decision stream (10 seconds):")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 import time
@@ -9,6 +10,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.makedirs("../docs/figures", exist_ok=True)
 
 from core.chaos.nihde import NIHDE
+from core.chaos.lyapunov import lyapunov_spectrum
 
 def fake_kyber():
     return 1184, 32  
@@ -19,7 +21,6 @@ def fake_dilithium():
 
 print("Initializing Aether hyperchaotic engine with LIVE QRNG seed...")
 engine = NIHDE(use_live_qrng=True)  
-time.sleep(1)  
 
 layers = [
     "MDI-QKD           (quantum hardware stub)",
@@ -35,30 +36,39 @@ print("="*82)
 
 start_time = time.perf_counter()
 
-for i in range(100):
-    choice = engine.decide()
-
-    if choice == 0:
-        print(f"t={i*0.1:5.1f}s → {layers[0]}")
-    elif choice == 1:
-        print(f"t={i*0.1:5.1f}s → {layers[1]}")
-    elif choice == 2:
-        ct, ss = fake_kyber()
-        print(f"t={i*0.1:5.1f}s → {layers[2]} → ct={ct} B, secret={ss} B")
-    elif choice == 3:
-        sig, ok = fake_dilithium()
-        print(f"t={i*0.1:5.1f}s → {layers[3]} → sig={sig} B, verified={ok}")
-
-    time.sleep(0.1)
+async def decision_stream():
+    # 10 decisions per second from the async stream instead of sleep-paced calls
+    i = 0
+    async for choice in engine.stream(rate=10):
+        if choice == 0:
+            print(f"t={i*0.1:5.1f}s → {layers[0]}")
+        elif choice == 1:
+            print(f"t={i*0.1:5.1f}s → {layers[1]}")
+        elif choice == 2:
+            ct, ss = fake_kyber()
+            print(f"t={i*0.1:5.1f}s → {layers[2]} → ct={ct} B, secret={ss} B")
+        elif choice == 3:
+            sig, ok = fake_dilithium()
+            print(f"t={i*0.1:5.1f}s → {layers[3]} → sig={sig} B, verified={ok}")
+        i += 1
+        if i == 100:
+            break
+
+asyncio.run(decision_stream())
 
 print("\nMeasuring decision latency (10,000 iterations)...")
+metrics = engine.enable_metrics(timing=True)
 decisions = []
-t0 = time.perf_counter_ns()
 for _ in range(10000):
     decisions.append(engine.decide())
-t1 = time.perf_counter_ns()
-latency_ns = (t1 - t0) / 10000
-print(f"Average decision latency: {latency_ns:.1f} ns ({latency_ns/1000:.2f} µs)")
+latency = metrics.to_dict()["latency"]["decide"]
+engine.disable_metrics()
+print(f"Decision latency: mean {latency['mean_ns']:.1f} ns · p50 {latency['p50_ns']} ns · "
+      f"p99 {latency['p99_ns']} ns · p99.9 {latency['p99.9_ns']} ns")
+
+print("Estimating Lyapunov spectrum of the seeded engine...")
+exponents, d_ky = lyapunov_spectrum(engine.system, steps=10000, seed=engine.seed, **engine.param_values())
+print(f"Lyapunov exponents: {np.array2string(exponents[0], precision=4)} · Kaplan–Yorke dimension = {d_ky[0]:.3f}")
 
 print("Generating unique volume-filling 3D hyperchaotic attractor...")
 traj = engine.get_attractor(25000)
@@ -74,7 +84,7 @@ for pane in (ax.xaxis.pane, ax.yaxis.pane, ax.zaxis.pane):
 
 ax.grid(True, color='#333333', alpha=0.2)
 plt.title("Aether – Live QRNG-Seeded Hyperchaotic Attractor\n"
-          "Lyapunov dimension = 3.000 · Quantum entropy source: ANU QRNG",
+          f"Lyapunov dimension = {d_ky[0]:.3f} · Quantum entropy source: ANU QRNG",
           color='white', fontsize=15, pad=30)
 
 save_path = "../docs/figures/aether_attractor.png"
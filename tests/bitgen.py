@@ -0,0 +1,109 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+
+import numpy as np
+from cffi import FFI
+from numpy.random import Generator
+
+import core.chaos.bitgen as bitgen
+from core.chaos.bitgen import NIHDEBitGenerator
+from core.chaos.nihde import NIHDE
+from report import report
+
+WORDS = 1024
+
+
+def raised(call, timeout=10):
+    # The error call() raised, "no error", or "hung" if it did not return
+    # (a rejection sampler spinning on constant words never does).
+    outcome = []
+
+    def run():
+        try:
+            call()
+            outcome.append("no error")
+        except RuntimeError as e:
+            outcome.append(str(e))
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    return outcome[0] if outcome else "hung"
+
+
+def failing_refill(bg, draw=lambda rng: rng.integers(0, 2 ** 63, WORDS, dtype=np.uint64)):
+    # Draws one full buffer, then makes the next refill raise. Returns the
+    # Generator and the error draw(rng) raised.
+    rng = Generator(bg)
+    rng.integers(0, 2 ** 63, WORDS, dtype=np.uint64)
+
+    def broken():
+        raise RuntimeError("refill failed")
+
+    refill, bg._refill = bg._refill, broken
+    error = raised(lambda: draw(rng))
+    bg._refill = refill
+    return rng, error
+
+
+def rejection_draws():
+    # Ranges that are not a power of two go through numpy's rejection loop.
+    return {name: failing_refill(NIHDEBitGenerator(seed=5, buffer_words=WORDS), draw)[1]
+            for name, draw in (("integers(0, 3)", lambda rng: rng.integers(0, 3, 10)),
+                               ("choice(3)", lambda rng: rng.choice(3, 10)))}
+
+
+results = []
+
+# 1. A refill error reaches the caller of the Generator method.
+bg = NIHDEBitGenerator(seed=5, buffer_words=WORDS)
+rng, error = failing_refill(bg)
+results.append(("Refill error raised from Generator", error == "refill failed",
+                f"compiled kernels: {bg.compiled}"))
+
+# 2. The consumed buffer is never served again; drawing resumes afresh.
+spent = bg._buf.copy()
+after = rng.integers(0, 2 ** 63, WORDS, dtype=np.uint64)
+results.append(("No stale buffer after the error", not np.isin(after, spent).any(),
+                f"{WORDS} new words"))
+
+# 3. Rejection samplers still finish and raise after a failed refill.
+draws = rejection_draws()
+results.append(("integers(0, 3) and choice(3) raise", set(draws.values()) == {"refill failed"},
+                ", ".join(f"{k}: {v}" for k, v in draws.items())))
+
+# 4. A health alarm with raise_on_failure=True gets through the callback,
+# also from a rejection sampler.
+alarms = []
+for draw in (lambda rng: rng.random(WORDS), lambda rng: rng.integers(0, 3, WORDS)):
+    engine = NIHDE(use_live_qrng=False, seed=7)
+    engine.enable_health(raise_on_failure=True)
+    bank = engine._lane_bank(1024)
+    bank.state[0] = 0.0
+    for name in bank.param_names:
+        getattr(bank, name)[0] = 0.0
+    rng = Generator(NIHDEBitGenerator(engine))
+    alarms.append(raised(lambda: draw(rng)))
+results.append(("Health alarm raised from Generator", all(a.startswith("health test failure") for a in alarms),
+                alarms[0]))
+
+# 5. The ABI-mode fallback callbacks behave the same way.
+backend, ffi = bitgen._backend, FFI()
+ffi.cdef(bitgen._BITGEN_CDEF)
+bitgen._backend = (ffi, None)
+try:
+    bg = NIHDEBitGenerator(seed=5, buffer_words=WORDS)
+    rng, error = failing_refill(bg)
+    spent = bg._buf.copy()
+    after = rng.integers(0, 2 ** 63, WORDS, dtype=np.uint64)
+    draws = rejection_draws()
+finally:
+    bitgen._backend = backend
+results.append(("ABI fallback raises, no stale buffer",
+                error == "refill failed" and not np.isin(after, spent).any()
+                and set(draws.values()) == {"refill failed"}, ""))
+
+report("NIHDE BIT GENERATOR ERROR PATH", results)
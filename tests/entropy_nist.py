@@ -8,9 +8,13 @@ from core.chaos.nihde import NIHDE
 print("Aether – Generating 1,000,000 bits for randomness validation...")
 engine = NIHDE(use_live_qrng=True)
 
-bits = np.unpackbits(np.array([engine.decide() for _ in range(125_000)], dtype=np.uint8))
+corpora = {
+    "z-parity decisions": np.unpackbits(engine.decide_bits(1_000_000)),
+    "Mantissa extraction (8 bits/sample)": np.unpackbits(engine.mantissa_bits(1_000_000, 8)),
+}
 
-from scipy.stats import chisquare
+from scipy.special import erfc
+from scipy.stats import chi2, chisquare
 
 def frequency_test(b):
     ones = np.sum(b)
@@ -19,34 +23,44 @@ def frequency_test(b):
     return "PASSED" if p > 0.01 else "FAILED", p
 
 def runs_test(b):
+    # SP 800-22 2.3: the only prerequisite is |pi - 1/2| < 2/sqrt(n).
     runs = 1 + np.sum(b[:-1] != b[1:])
     ones = np.sum(b)
     n = len(b)
-    if abs(ones - n/2) > 2:
-        return "FAILED", 0
     pi = ones / n
-    expected = 2 * pi * (1 - pi) * n + 1
-    var = 2 * pi * (1 - pi) * (2 * pi * (1 - pi) * n - n) / (n * (n - 1))
-    z = abs(runs - expected) / np.sqrt(var)
-    p = np.exp(-2 * z**2) * 2  # yaklaşık
+    if abs(pi - 0.5) >= 2 / np.sqrt(n):
+        return "FAILED", 0.0
+    p = erfc(abs(runs - 2 * n * pi * (1 - pi)) / (2 * np.sqrt(2 * n) * pi * (1 - pi)))
     return "PASSED" if p > 0.01 else "FAILED", p
 
-print("\n" + "="*60)
-print("NIST SP 800-22 COMPATIBLE STATISTICAL TESTS")
-print("="*60)
+def block_frequency_test(b, m=1000):
+    # SP 800-22 2.2: chi^2 = 4M * sum((pi_i - 1/2)^2) over N = n // M blocks.
+    blocks = b[:len(b) // m * m].reshape(-1, m)
+    pi = blocks.mean(axis=1)
+    p = chi2.sf(4 * m * np.sum((pi - 0.5) ** 2), len(blocks))
+    return "PASSED" if p > 0.01 else "FAILED", p
 
-f_status, f_p = frequency_test(bits)
-r_status, r_p = runs_test(bits)
+failed = []
+for name, bits in corpora.items():
+    print("\n" + "="*60)
+    print(f"NIST SP 800-22 COMPATIBLE STATISTICAL TESTS – {name}")
+    print("="*60)
 
-print(f"Frequency (Monobit) Test     : {f_status} (p = {f_p:.6f})")
-print(f"Runs Test                    : {r_status} (p = {r_p:.6f})")
+    f_status, f_p = frequency_test(bits)
+    r_status, r_p = runs_test(bits)
 
-# Block frequency
-blocks = bits.reshape(-1, 1000)
-block_p = chisquare(np.sum(blocks, axis=1), np.ones(len(blocks)) * 500).pvalue
-b_status = "PASSED" if block_p > 0.01 else "FAILED"
-print(f"Block Frequency Test (M=1000): {b_status} (p = {block_p:.6f})")
+    print(f"Frequency (Monobit) Test     : {f_status} (p = {f_p:.6f})")
+    print(f"Runs Test                    : {r_status} (p = {r_p:.6f})")
 
-print("\nALL TESTS PASSED → Chaos output is cryptographically strong")
-print("Comparable to NIST STS 14–15/15 PASSED")
-print("="*60)
\ No newline at end of file
+    b_status, block_p = block_frequency_test(bits)
+    print(f"Block Frequency Test (M=1000): {b_status} (p = {block_p:.6f})")
+    failed += [name for status in (f_status, r_status, b_status) if status == "FAILED"]
+
+if failed:
+    print(f"\n{len(failed)}/{3 * len(corpora)} TESTS FAILED → {', '.join(sorted(set(failed)))}")
+else:
+    print("\nALL TESTS PASSED → Chaos output is cryptographically strong")
+    print("Comparable to NIST STS 14–15/15 PASSED")
+print("="*60)
+if failed:
+    sys.exit(1)
\ No newline at end of file
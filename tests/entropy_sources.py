@@ -0,0 +1,185 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import core.chaos.pool as pool_module
+from core.chaos.pool import EntropyPool, pool_seed, set_seed_selector
+from core.chaos.session import QRNGSession
+from core.chaos.sources import ANUSource, BeaconSource, EntropySelector, FileSource, OSSource
+from report import report
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # /anu/fast, /anu/slow (0.5 s), /anu/stall (4 s), /drand/public/latest,
+    # /flaky (500 on every other request), anything else 500. Keep-alive, so client ports
+    # count connections.
+    protocol_version = "HTTP/1.1"
+    hits = {}
+    clients = set()
+
+    def do_GET(self):
+        StubHandler.clients.add(self.client_address)
+        StubHandler.hits[self.path] = StubHandler.hits.get(self.path, 0) + 1
+        if self.path == "/flaky" and StubHandler.hits[self.path] % 2:
+            body = None
+        elif self.path.startswith("/anu/") or self.path == "/flaky":
+            if self.path.startswith("/anu/slow"):
+                time.sleep(0.5)
+            if self.path.startswith("/anu/stall"):
+                time.sleep(4)
+            blocks = int(parse_qs(urlsplit(self.path).query).get("length", ["1"])[0])
+            body = {"success": True, "data": [os.urandom(2048).hex() for _ in range(blocks)]}
+        elif self.path == "/drand/public/latest":
+            body = {"round": 1, "randomness": os.urandom(32).hex()}
+        else:
+            body = None
+        if body is None:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base = f"http://127.0.0.1:{server.server_port}"
+anu_query = "?length={length}&type=hex16&size={size}"
+
+# All stub paths share one host, so these sources get a session whose
+# circuit breaker stays out of the way; it is tested on its own below.
+stub = QRNGSession(backoff=0.01, breaker_failures=1000)
+slow = ANUSource(base + "/anu/slow" + anu_query, name="anu-slow", session=stub)
+fast = ANUSource(base + "/anu/fast" + anu_query, name="anu-fast", session=stub)
+broken = ANUSource(base + "/down" + anu_query, name="anu-down", session=stub)
+beacon = BeaconSource(base + "/drand", name="drand-stub", session=stub)
+
+results = []
+
+# 1. Hedging: the slow source is tried first, the fast one wins the race.
+selector = EntropySelector([slow, fast], hedge=2, hedge_delay=0.05)
+t0 = time.perf_counter()
+data = selector.fetch(4096)
+elapsed = time.perf_counter() - t0
+results.append(("Hedged fetch beats slow source", len(data) == 4096 and elapsed < 0.4,
+                f"{len(data)} bytes in {elapsed * 1000:.0f} ms"))
+
+# 2. Ranking: after both have answered, the fast source is ranked first.
+time.sleep(0.6)
+order = [s.name for s in selector.ranked()]
+results.append(("Fastest healthy source ranked first", order[0] == "anu-fast", " > ".join(order)))
+
+# 3. Failover: the beacon answers and the broken source drops to the back.
+selector = EntropySelector([broken, beacon], hedge=1)
+sizes = [len(selector.fetch(64)) for _ in range(3)]
+order = [s.name for s in selector.ranked()]
+results.append(("Failover to beacon", sizes == [32, 32, 32] and order[-1] == "anu-down",
+                " > ".join(order)))
+
+# 4. Health: after max_failures in a row a source is benched.
+selector = EntropySelector([broken], max_failures=2, cooldown=60)
+errors = []
+for _ in range(3):
+    try:
+        selector.fetch(64)
+    except ValueError as e:
+        errors.append(str(e))
+results.append(("Failing source benched", len(errors) == 3 and errors[-1] == "no healthy entropy source",
+                f"failures = {selector.to_dict()['anu-down']['failures']}"))
+
+# 5. Local sources: os.urandom and a file.
+with tempfile.NamedTemporaryFile(delete=False) as f:
+    f.write(os.urandom(100))
+source = FileSource(f.name)
+ok = len(source.fetch(64)) == 64 and len(source.fetch(64)) == 36 and len(OSSource().fetch(16)) == 16
+source.close()
+os.unlink(f.name)
+results.append(("urandom and file sources", ok, ""))
+
+# 6. Pooled session: ten fetches share one keep-alive connection.
+session = QRNGSession(backoff=0.01)
+StubHandler.clients.clear()
+for _ in range(10):
+    session.get_json(base + "/drand/public/latest")
+results.append(("Pooled session reuses one connection", len(StubHandler.clients) == 1,
+                f"10 requests over {len(StubHandler.clients)} connection(s)"))
+
+# 7. Retries: /flaky fails every other request but every fetch succeeds.
+ok = all(session.get_json(base + "/flaky")["success"] for _ in range(5))
+results.append(("Retry with jittered backoff", ok and StubHandler.hits["/flaky"] == 10,
+                f"{StubHandler.hits['/flaky']} requests for 5 fetches"))
+
+# 8. Circuit breaker: after 2 failed fetches the host is no longer called.
+session = QRNGSession(retries=1, backoff=0.01, breaker_failures=2, breaker_reset=60)
+errors = []
+for _ in range(4):
+    try:
+        session.get_json(base + "/down")
+    except Exception as e:
+        errors.append(type(e).__name__)
+results.append(("Circuit breaker opens", StubHandler.hits["/down"] == 4 and errors[-2:] == ["RuntimeError"] * 2,
+                f"{StubHandler.hits['/down']} requests, {', '.join(errors)}"))
+
+# 9. Pool refills only from full batches: a 32-byte beacon answer is rejected.
+with tempfile.TemporaryDirectory() as d:
+    pool = EntropyPool(os.path.join(d, "qrng.pool"), batch=4096, fetch=beacon.fetch)
+    try:
+        pool.refill()
+        rejected = False
+    except ValueError:
+        rejected = True
+    empty = pool.size()
+    pool.fetch = fast.fetch
+    pool.refill()
+    results.append(("Pool rejects partial refills", rejected and empty == 0 and pool.size() == 4096,
+                    f"beacon: {empty} bytes stored, ANU: {pool.size()} bytes"))
+
+# 10. pool_seed() falls back to the selector when the pool cannot refill:
+# the fastest healthy source wins, and the beacon's answer is not stored.
+with tempfile.TemporaryDirectory() as d:
+    default, pool_module._default = pool_module._default, EntropyPool(os.path.join(d, "qrng.pool"), fetch=broken.fetch)
+    try:
+        _, hedged = pool_seed(selector=EntropySelector([broken, slow, fast], hedge_delay=0.05))
+        set_seed_selector([broken, beacon])
+        _, public = pool_seed()
+        stored = pool_module._default.size()
+    finally:
+        pool_module._default = default
+        pool_module._selector = None
+results.append(("Seed fallback through selector", hedged == "anu-fast (fallback)" and
+                public == "drand-stub (public, fallback)" and stored == 0, f"{hedged}; {public}"))
+
+# 11. A losing hedged request (4 s stall) does not hold up interpreter exit.
+script = f"""
+import sys
+sys.path.insert(0, {os.path.dirname(os.path.dirname(os.path.abspath(__file__)))!r})
+from core.chaos.session import QRNGSession
+from core.chaos.sources import ANUSource, EntropySelector, OSSource
+stall = ANUSource({base!r} + "/anu/stall" + {anu_query!r}, name="anu-stall", session=QRNGSession())
+print(len(EntropySelector([stall, OSSource()], hedge_delay=0.05).fetch(64)))
+"""
+t0 = time.perf_counter()
+out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=30).stdout.strip()
+elapsed = time.perf_counter() - t0
+results.append(("Losing request does not delay exit", out == "64" and elapsed < 3,
+                f"process exited after {elapsed:.1f} s"))
+
+server.shutdown()
+
+report("ENTROPY SOURCES + POOLED QRNG SESSION (local stub server)", results)
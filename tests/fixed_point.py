@@ -0,0 +1,61 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import numpy as np
+from core.chaos.fixedpoint import FixedPointEnsemble
+from core.chaos.nihde import NIHDE, NIHDEEnsemble
+from report import report
+
+results = []
+
+# 1. The scalar path (Python ints) matches a one-lane FixedPointEnsemble.
+engine = NIHDE(use_live_qrng=False, seed=3, fixed_point=True)
+one = FixedPointEnsemble(1, engine.a, engine.b, engine.c, engine.dt, seed=0)
+one.state = np.round(engine.state * one.one).astype(np.int64)[None]
+traj = engine.get_attractor(5000)
+one.step(5000)
+results.append(("Scalar path matches FixedPointEnsemble", np.array_equal(traj[-1] * one.one, one.state[0]),
+                f"state after 5,000 steps {traj[-1].round(4).tolist()}"))
+
+# 2. decide(), decide_bits() and mantissa_bits() continue identically after
+# a snapshot round trip, and the header marks the engine as fixed-point.
+engine = NIHDE(use_live_qrng=False, seed=4, fixed_point=True)
+engine.decide_bits(4096)
+[engine.decide() for _ in range(50)]
+clone = NIHDE.restore(engine.snapshot())
+a = ([engine.decide() for _ in range(200)], engine.decide_bits(1 << 16).tobytes(), engine.mantissa_bits(1 << 16).tobytes())
+b = ([clone.decide() for _ in range(200)], clone.decide_bits(1 << 16).tobytes(), clone.mantissa_bits(1 << 16).tobytes())
+results.append(("Snapshot restores fixed-point engine", clone.fixed_point and a == b,
+                f"{len(engine.snapshot()):,} byte snapshot"))
+
+# 3. The same seed gives the same stream as a fresh engine; spawned
+# children stay in fixed-point mode and do not depend on earlier bulk calls.
+fresh = NIHDE(use_live_qrng=False, seed=4, fixed_point=True)
+fresh.decide_bits(4096)
+[fresh.decide() for _ in range(250)]
+child = fresh.spawn(1)[0]
+unused = NIHDE(use_live_qrng=False, seed=4, fixed_point=True).spawn(1)[0]
+results.append(("Seeded replay and spawn", fresh.decide_bits(1 << 16).tobytes() == a[1] and child.fixed_point
+                and child.decide_bits(4096).tobytes() == unused.decide_bits(4096).tobytes(), ""))
+
+# 4. Only Rössler under Euler has a fixed-point form.
+try:
+    NIHDE(use_live_qrng=False, seed=1, integrator="rk4", fixed_point=True)
+    rejected = False
+except ValueError:
+    rejected = True
+results.append(("Other integrators rejected", rejected, ""))
+
+# Timing is machine-dependent, so it is reported rather than checked.
+timings = {}
+for name, bank in (("fixed", FixedPointEnsemble(8192, seed=1)), ("float", NIHDEEnsemble(8192, seed=1))):
+    t0 = time.perf_counter()
+    for _ in range(50):
+        bank.decide()
+    timings[name] = (time.perf_counter() - t0) / 50
+
+report("FIXED-POINT NIHDE MODE", results,
+       [f"8192 lanes: {timings['fixed'] * 1e3:.2f} ms fixed vs {timings['float'] * 1e3:.2f} ms float per decision"])
@@ -0,0 +1,106 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+
+import numpy as np
+from core.chaos.health import HealthTests
+from core.chaos.nihde import NIHDE
+from report import report
+
+LANES = 64
+
+
+def watched_engine(seed, **health):
+    engine = NIHDE(use_live_qrng=False, seed=seed)
+    alarms = []
+    engine.enable_health(callback=alarms.append, **health)
+    return engine, engine._lane_bank(LANES), alarms
+
+
+def stuck_engine(seed=7, **health):
+    # Lane 0 is parked on the Rössler fixed point with a = b = c = 0, so its
+    # state (and every decision) never changes.
+    engine, bank, alarms = watched_engine(seed, **health)
+    bank.state[0] = 0.0
+    for name in bank.param_names:
+        getattr(bank, name)[0] = 0.0
+    return engine, bank, alarms
+
+
+results = []
+
+# 1. Healthy output raises no alarm.
+engine = NIHDE(use_live_qrng=False, seed=1)
+health = engine.enable_health()
+engine.decide_bits(1024 * 2048)
+engine.mantissa_bits(1_000_000)
+results.append(("No alarm on healthy lanes", not health.alarm,
+                f"{health.tests['decide_bits'].samples:,} bits, {health.tests['raw_samples'].samples:,} words"))
+
+# 2. Repetition Count Test catches the stuck lane in decide_bits.
+engine, bank, alarms = stuck_engine()
+engine.decide_bits(LANES * 256, lanes=LANES)
+rct = {a["column"] for a in alarms if a["test"] == "rct"}
+results.append(("RCT flags stuck lane (decide_bits)", rct == {0}, f"columns {sorted(rct)}"))
+
+# 3. ... and its frozen coordinates in the raw samples behind mantissa_bits.
+alarms.clear()
+engine.mantissa_bits(LANES * 3 * 8 * 64, lanes=LANES)
+raw = {a["column"] for a in alarms if a["stream"] == "raw_samples"}
+results.append(("RCT flags stuck lane (raw samples)", raw == {0, 1, 2}, f"columns {sorted(raw)}"))
+
+# 4. Adaptive Proportion Test catches a lane that emits 70% ones.
+engine, bank, alarms = watched_engine(seed=8)
+rng = np.random.default_rng(0)
+decide = bank.decide
+
+
+def biased():
+    bits = decide()
+    bits[1] = rng.random() < 0.7
+    return bits
+
+
+bank.decide = biased
+engine.decide_bits(LANES * 4096, lanes=LANES)
+apt = {a["column"] for a in alarms if a["test"] == "apt"}
+results.append(("APT flags biased lane", apt == {1}, f"columns {sorted(apt)}"))
+
+# 5. Callback received every counted failure.
+counted = sum(sum(t.failures.values()) for t in engine.health.tests.values())
+results.append(("Callback fired for every failure", len(alarms) == counted > 0, f"{len(alarms)} callbacks"))
+
+# 6. raise_on_failure reaches decide() through the prefetch worker.
+engine, bank, alarms = stuck_engine(raise_on_failure=True)
+engine.start_prefetch(capacity=LANES * 64, lanes=LANES)
+outcome = []
+
+
+def consume():
+    try:
+        for _ in range(LANES * 1024):
+            engine.decide()
+        outcome.append("no error")
+    except RuntimeError as e:
+        outcome.append(str(e))
+
+
+worker = threading.Thread(target=consume, daemon=True)
+worker.start()
+worker.join(10)
+results.append(("Prefetch alarm raised in decide()", outcome[:1] == ["health test failure: rct on decide_bits column 0"],
+                outcome[0] if outcome else "decide() hung"))
+
+# 7. The RCT fires on exactly C identical samples, also at stream start.
+rct = {}
+for name, chunk in (("C-1 leading", np.zeros(30)), ("C-1 after other", np.r_[1, np.zeros(30)]),
+                    ("C leading", np.zeros(31))):
+    tests = HealthTests(binary=True)
+    rct[name] = bool(tests.feed(chunk.astype(np.uint8)))
+results.append(("RCT counts the first sample once",
+                rct == {"C-1 leading": False, "C-1 after other": False, "C leading": True},
+                f"cutoff {tests.rct_cutoff}, fired on: {', '.join(k for k, v in rct.items() if v)}"))
+
+report("SP 800-90B CONTINUOUS HEALTH TESTS (injected faults)", results)
@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from core.chaos.integrators import DormandPrince
+from core.chaos.nihde import NIHDE, NIHDEEnsemble
+from report import report
+
+
+def fresh_copy(engine):
+    # Same engine state with an empty FSAL cache.
+    clone = NIHDE.restore(engine.snapshot())
+    clone._integrator.reset()
+    return clone
+
+
+results = []
+
+# 1. First same as last: six RHS evaluations per accepted step.
+calls = [0]
+
+
+def rossler(s):
+    calls[0] += 1
+    return np.array([-s[1] - s[2], s[0] + 0.2 * s[1], 0.2 + s[2] * (s[0] - 5.7)])
+
+
+# Loose tolerances and a fixed dt, so no step is rejected.
+integ, s = DormandPrince(0.01, rtol=1.0, atol=1.0, dt_max=0.01), np.array([1.0, 1.0, 1.0])
+s = integ.step(rossler, s)
+calls[0] = 0
+for _ in range(100):
+    s = integ.step(rossler, s)
+results.append(("Six RHS evaluations per step", calls[0] == 600, f"{calls[0]} for 100 steps"))
+
+# 2. A parameter change drops the cached stage (scalar engine).
+engine = NIHDE(use_live_qrng=False, seed=1, integrator="dopri5")
+engine.get_attractor(100)
+clone = fresh_copy(engine)
+engine.c = clone.c = 9.0
+diff = np.abs(engine.get_attractor(50) - clone.get_attractor(50)).max()
+results.append(("Parameter change resets FSAL (NIHDE)", diff == 0, f"max difference {diff:.3g}"))
+
+# 3. ... also when a lane's parameter array is edited in place.
+banks = [NIHDEEnsemble(16, integrator="dopri5", seed=2) for _ in range(2)]
+for bank in banks:
+    bank.step(50)
+banks[1]._integrator.reset()
+for bank in banks:
+    bank.c[3] = 9.0
+    bank.step(20)
+diff = np.abs(banks[0].state - banks[1].state).max()
+results.append(("Parameter change resets FSAL (ensemble)", diff == 0, f"max difference {diff:.3g}"))
+
+# 4. An in-place state edit drops it too.
+engine = NIHDE(use_live_qrng=False, seed=3, integrator="dopri5")
+engine.get_attractor(100)
+clone = fresh_copy(engine)
+engine.x = clone.x = 1.5
+diff = np.abs(engine.get_attractor(50) - clone.get_attractor(50)).max()
+results.append(("State edit resets FSAL", diff == 0, f"max difference {diff:.3g}"))
+
+report("BATCHED INTEGRATORS (Dormand–Prince FSAL)", results)
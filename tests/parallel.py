@@ -0,0 +1,38 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from core.chaos.nihde import NIHDE
+from core.chaos.parallel import generate_bits
+from report import report
+
+SHARD = 1 << 16
+N = 5 * SHARD + 13 * 8
+
+if __name__ == "__main__":
+    results = []
+
+    # 1. The output for a root seed does not depend on the worker count.
+    runs = {w: generate_bits(N, workers=w, seed=3, shard_bits=SHARD) for w in (1, 2, 3)}
+    same = all(np.array_equal(runs[1], runs[w]) for w in (2, 3))
+    results.append(("Same bits for 1, 2 and 3 workers", same, f"{N:,} bits in {-(-N // SHARD)} shards"))
+
+    # 2. Each shard is the decide_bits() stream of its own spawned engine.
+    children = np.random.SeedSequence(3).spawn(-(-N // SHARD))
+    direct = np.concatenate([NIHDE(use_live_qrng=False, seed=c).decide_bits(min(SHARD, N - i * SHARD))
+                             for i, c in enumerate(children)])
+    results.append(("Shards match spawned engines", np.array_equal(runs[1], direct), ""))
+
+    # 3. Odd n: ceil(n / 8) bytes, a prefix of the longer run, pad bits zero.
+    odd = generate_bits(N - 5, workers=2, seed=3, shard_bits=SHARD)
+    tail = int(runs[1][len(odd) - 1]) & (0xFF << (8 - (N - 5) % 8)) & 0xFF
+    results.append(("Odd n is a masked prefix", len(odd) == -(-(N - 5) // 8)
+                    and np.array_equal(odd[:-1], runs[1][:len(odd) - 1]) and odd[-1] == tail,
+                    f"{len(odd):,} bytes, last byte {odd[-1]:#04x}"))
+
+    # 4. n = 0 gives an empty buffer.
+    empty = generate_bits(0, workers=2, seed=3, shard_bits=SHARD)
+    results.append(("n = 0", empty.dtype == np.uint8 and len(empty) == 0, f"{len(empty)} bytes"))
+
+    report("SHARDED MULTI-PROCESS BIT GENERATION", results)
@@ -0,0 +1,21 @@
+# Shared footer for the check scripts: prints the PASSED/FAILED table and
+# exits with status 1 if any check failed, so a script run can gate a merge.
+
+import sys
+
+
+def report(title, results, notes=()):
+    # results: (name, ok, detail) tuples; notes: extra lines printed under
+    # the summary.
+    print("=" * 70)
+    print(f" {title}")
+    print("=" * 70)
+    for i, (name, ok, detail) in enumerate(results, 1):
+        print(f"{i}. {name:<45} → {'PASSED' if ok else 'FAILED'}  {detail}")
+    passed = sum(bool(ok) for _, ok, _ in results)
+    print(f"\n{passed}/{len(results)} TESTS PASSED")
+    for line in notes:
+        print(line)
+    print("=" * 70)
+    if passed < len(results):
+        sys.exit(1)
@@ -0,0 +1,42 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import warnings
+
+import numpy as np
+from core.chaos.nihde import NIHDE, NIHDEEnsemble
+from core.chaos.systems import SYSTEMS
+from report import report
+
+LANES = 1024
+STEPS = 100_000
+
+results = []
+
+# 1-4. Every registered system stays on its attractor for 10**5 steps of
+# the default integrator (Euler) at its default dt, in every lane.
+for name in SYSTEMS:
+    bank = NIHDEEnsemble(LANES, name, seed=1)
+    with np.errstate(all="ignore"):
+        for _ in range(STEPS // 1000):
+            bank.step(1000)
+    bad = int(np.count_nonzero(~np.isfinite(bank.state).all(axis=1)))
+    results.append((f"{name} bounded under Euler", bad == 0,
+                    f"dt = {bank.dt}, {bad}/{LANES} lanes diverged, max |s| = {np.nanmax(np.abs(bank.state)):.1f}"))
+
+# 5. A lane that does diverge is re-seeded instead of emitting constant bits.
+engine = NIHDE(use_live_qrng=False, seed=2, system="rossler4d")
+bank = engine._lane_bank(64)
+bank.state[3] = np.nan
+with warnings.catch_warnings(record=True) as caught:
+    warnings.simplefilter("always")
+    engine.decide_bits(64 * 16, lanes=64)
+    engine.mantissa_bits(64 * 4 * 8, lanes=64)
+    bank.state[5] = np.inf
+    engine.mantissa_bits(64 * 4 * 8, lanes=64)
+reseeded = [str(w.message) for w in caught if "re-seeded" in str(w.message)]
+results.append(("Diverged lanes re-seeded", np.isfinite(bank.state).all() and len(reseeded) == 2,
+                "; ".join(reseeded)))
+
+report("CHAOTIC SYSTEM REGISTRY – LONG-RUN STABILITY", results)